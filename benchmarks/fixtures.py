@@ -0,0 +1,98 @@
+"""
+Synthetic CMS trees, partials and forms for the benchmarks.
+"""
+from cms.api import add_plugin, create_page, create_title
+from cms.models import CMSPlugin, Placeholder, StaticPlaceholder
+from cms.plugin_pool import plugin_pool
+from cms.utils.conf import get_cms_setting
+from django import forms
+from django.contrib.auth.models import Group
+
+from djangocms_spa.cms_plugins import SPAPluginBase
+from djangocms_spa.forms import SpaApiModelForm
+
+
+class BenchmarkPlugin(SPAPluginBase):
+    name = 'Benchmark'
+    model = CMSPlugin
+    allow_children = True
+    frontend_component_name = 'cmp-benchmark'
+
+    def render_spa(self, request, context, instance):
+        context = super(BenchmarkPlugin, self).render_spa(request, context, instance)
+        context['content']['text'] = 'Plugin %s in placeholder %s' % (instance.pk, instance.placeholder_id)
+        return context
+
+
+def register_benchmark_plugin():
+    if BenchmarkPlugin.__name__ not in plugin_pool.plugins:
+        plugin_pool.register_plugin(BenchmarkPlugin)
+
+
+def add_plugin_tree(placeholder, language, depth, fan_out, target=None):
+    """
+    Adds `fan_out` plugins to the placeholder (or the target plugin) and nests them `depth` levels deep.
+    """
+    plugin_count = 0
+    for position in range(fan_out):
+        plugin = add_plugin(placeholder, BenchmarkPlugin, language, target=target)
+        plugin_count += 1
+        if depth > 1:
+            plugin_count += add_plugin_tree(placeholder, language, depth - 1, fan_out, target=plugin)
+    return plugin_count
+
+
+def create_benchmark_page(languages, placeholder_count, depth, fan_out):
+    """
+    Creates and publishes a page with `placeholder_count` placeholders. Each placeholder gets a plugin tree in every
+    language. Returns the published page and the number of plugins per language.
+    """
+    template = get_cms_setting('TEMPLATES')[0][0]
+    page = create_page('Benchmark', template, languages[0], slug='benchmark')
+    for language in languages[1:]:
+        create_title(language, 'Benchmark %s' % language, page, slug='benchmark-%s' % language)
+
+    plugin_count = 0
+    for index in range(placeholder_count):
+        placeholder = Placeholder.objects.create(slot='benchmark-%s' % index)
+        page.placeholders.add(placeholder)
+        for language in languages:
+            plugin_count += add_plugin_tree(placeholder, language, depth, fan_out)
+
+    for language in languages:
+        page.publish(language)
+
+    return page.reload().get_public_object(), plugin_count // len(languages)
+
+
+def create_benchmark_partials(languages, partial_count, depth, fan_out):
+    """
+    Creates static placeholders with plugin trees in their public placeholder and returns their codes.
+    """
+    codes = []
+    for index in range(partial_count):
+        static_placeholder = StaticPlaceholder.objects.create(code='benchmark-partial-%s' % index)
+        for language in languages:
+            add_plugin_tree(static_placeholder.public, language, depth, fan_out)
+        codes.append(static_placeholder.code)
+    return codes
+
+
+def get_benchmark_form_class(choice_count):
+    """
+    Returns a model form with a select of `choice_count` options and a couple of simple fields.
+    """
+    choices = [('', '---------')] + [(str(index), 'Option %s' % index) for index in range(choice_count)]
+
+    class BenchmarkForm(SpaApiModelForm):
+        country = forms.ChoiceField(choices=choices, required=False)
+        region = forms.ChoiceField(choices=choices, widget=forms.RadioSelect, required=False)
+        email = forms.EmailField(required=False, help_text='We never share your address.')
+        message = forms.CharField(widget=forms.Textarea, required=False)
+        accept = forms.BooleanField(required=False)
+
+        class Meta:
+            model = Group
+            fields = ['name']
+
+    return BenchmarkForm
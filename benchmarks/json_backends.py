@@ -0,0 +1,97 @@
+#!/usr/bin/env python
+"""
+Compares the JSON backends of `djangocms_spa.json_encoders.dumps` on a synthetic page with 1,000 plugins.
+
+    python benchmarks/json_backends.py --plugins 1000 --repeat 20
+"""
+import argparse
+import json
+import os
+import sys
+import timeit
+
+from django.utils.functional import lazy
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from djangocms_spa.json_encoders import JSON_BACKENDS, LazyJSONEncoder, dumps  # noqa: E402
+
+lazy_str = lazy(str, str)
+
+
+def get_synthetic_page_data(plugin_count, fan_out=5):
+    """
+    Returns the data of a page with `plugin_count` plugins that are nested `fan_out` plugins per level. Every plugin
+    has a lazy string like the labels of real plugins.
+    """
+    plugin_number = 0
+
+    def get_plugin_data(depth):
+        nonlocal plugin_number
+        plugin_number += 1
+        data = {
+            'type': 'cmp-text',
+            'content': {
+                'text': '<p>Plugin %s with some content, umlauts (äöü) and a link to /de/page/.</p>' % plugin_number,
+                'label': lazy_str('Label %s' % plugin_number),
+                'position': plugin_number,
+                'ratio': plugin_number / 7,
+                'visible': True,
+                'image': None,
+            },
+        }
+
+        children = []
+        while depth < 3 and len(children) < fan_out and plugin_number < plugin_count:
+            children.append(get_plugin_data(depth + 1))
+        if children:
+            data['plugins'] = children
+        return data
+
+    plugins = []
+    while plugin_number < plugin_count:
+        plugins.append(get_plugin_data(0))
+
+    return {
+        'data': {
+            'containers': {
+                'main': {
+                    'type': 'cmp-main',
+                    'plugins': plugins,
+                }
+            },
+            'meta': {
+                'title': lazy_str('Benchmark'),
+                'description': '',
+            }
+        }
+    }
+
+
+def run(plugin_count, repeat):
+    data = get_synthetic_page_data(plugin_count)
+    reference = None
+
+    for backend in JSON_BACKENDS:
+        try:
+            output = dumps(data, cls=LazyJSONEncoder, backend=backend)
+        except ImportError:
+            print('%-8s not installed' % backend)
+            continue
+
+        # Only the `json` backend escapes non-ASCII characters and adds spaces, so the decoded values are compared.
+        if reference is None:
+            reference = json.loads(output)
+        identical = 'identical' if json.loads(output) == reference else 'DIFFERENT OUTPUT'
+
+        duration = min(timeit.repeat(lambda: dumps(data, cls=LazyJSONEncoder, backend=backend), number=1,
+                                     repeat=repeat))
+        print('%-8s %8.2f ms  %8d bytes  %s' % (backend, duration * 1000, len(output), identical))
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--plugins', type=int, default=1000)
+    parser.add_argument('--repeat', type=int, default=20)
+    arguments = parser.parse_args()
+    run(arguments.plugins, arguments.repeat)
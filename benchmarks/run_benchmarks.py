@@ -0,0 +1,183 @@
+#!/usr/bin/env python
+"""
+Benchmarks the page rendering pipeline on synthetic CMS trees. The benchmarks run against a test database of
+`benchmarks.settings` (or `--settings`) and record the duration and the number of queries of each stage as JSON.
+
+    python benchmarks/run_benchmarks.py --placeholders 4 --depth 3 --fan-out 5 --output bench_output.json
+    python benchmarks/run_benchmarks.py --compare bench_output.json
+"""
+import argparse
+import json
+import os
+import statistics
+import sys
+import time
+
+import django
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+
+def measure(name, func, repeat, setup=None):
+    from django.db import connection
+    from django.test.utils import CaptureQueriesContext
+
+    durations = []
+    query_counts = []
+    for iteration in range(repeat):
+        if setup:
+            setup()
+
+        with CaptureQueriesContext(connection) as captured_queries:
+            started = time.perf_counter()
+            func()
+            durations.append((time.perf_counter() - started) * 1000)
+        query_counts.append(len(captured_queries))
+
+    result = {
+        'name': name,
+        'median_ms': round(statistics.median(durations), 3),
+        'min_ms': round(min(durations), 3),
+        'queries': max(query_counts),
+    }
+    print('{name:<40} {median_ms:>10.2f} ms {min_ms:>10.2f} ms {queries:>6} queries'.format(**result))
+    return result
+
+
+def get_request(path, language_code):
+    from django.contrib.auth.models import AnonymousUser
+    from django.test import RequestFactory
+
+    request = RequestFactory().get(path)
+    request.user = AnonymousUser()
+    request.session = {}
+    request.LANGUAGE_CODE = language_code
+    return request
+
+
+def run_benchmarks(options):
+    from django.conf import settings
+    from django.core.cache import cache
+    from django.test.utils import override_settings
+    from django.utils import translation
+
+    from benchmarks.fixtures import (create_benchmark_page, create_benchmark_partials, get_benchmark_form_class,
+                                     register_benchmark_plugin)
+    from djangocms_spa.content_helpers import (get_frontend_data_dict_for_cms_page,
+                                               get_frontend_data_dict_for_partials)
+    from djangocms_spa.json_encoders import JSON_BACKENDS, dumps
+    from djangocms_spa.views import SpaCmsPageDetailApiView
+
+    languages = [language_code for language_code, language in settings.LANGUAGES][:options.languages]
+    language_code = languages[0]
+
+    register_benchmark_plugin()
+    page, plugin_count = create_benchmark_page(languages, options.placeholders, options.depth, options.fan_out)
+    partials = create_benchmark_partials(languages, options.partials, options.depth, options.fan_out)
+    title = page.title_set.get(language=language_code)
+    template = page.get_template()
+    print('Page with %s placeholders and %s plugins per language, %s partials.' % (
+        options.placeholders, plugin_count, len(partials)))
+
+    results = []
+    spa_settings = {
+        'DJANGOCMS_SPA_TEMPLATES': {template: {'frontend_component_name': 'benchmark', 'partials': partials}},
+        'DJANGOCMS_SPA_PARTIAL_CALLBACKS': {},
+        'DJANGOCMS_SPA_PLACEHOLDER_CACHE_TIMEOUT': 60 * 60 * 24,
+    }
+    with override_settings(**spa_settings), translation.override(language_code):
+        request = get_request('/', language_code)
+
+        def render_page():
+            return get_frontend_data_dict_for_cms_page(cms_page=page, cms_page_title=title, request=request)
+
+        def render_partials():
+            return get_frontend_data_dict_for_partials(partials=partials, request=request)
+
+        results.append(measure('cms_page (uncached)', render_page, options.repeat, setup=cache.clear))
+        results.append(measure('cms_page (placeholder cache)', render_page, options.repeat))
+        results.append(measure('partials (uncached)', render_partials, options.repeat, setup=cache.clear))
+        results.append(measure('partials (placeholder cache)', render_partials, options.repeat))
+
+        view = SpaCmsPageDetailApiView.as_view()
+        view_path = '/benchmark/?partials=%s' % ','.join(partials)
+
+        def render_view():
+            response = view(get_request(view_path, language_code), path=title.path)
+            assert response.status_code == 200, response.status_code
+            return response
+
+        results.append(measure('cache_view (miss)', render_view, options.repeat, setup=cache.clear))
+        results.append(measure('cache_view (hit)', render_view, options.repeat))
+
+        page_data = {'data': render_page(), 'partials': render_partials()}
+        for backend in JSON_BACKENDS:
+            try:
+                dumps(page_data, backend=backend)
+            except ImportError:
+                continue
+            results.append(measure('json (%s)' % backend, lambda: dumps(page_data, backend=backend),
+                                   options.repeat))
+
+        form_class = get_benchmark_form_class(options.choices)
+        results.append(measure('form get_spa_data_dict (%s choices)' % options.choices,
+                               lambda: form_class().get_spa_data_dict(), options.repeat))
+
+    return {
+        'parameters': vars(options),
+        'plugins_per_language': plugin_count,
+        'results': results,
+    }
+
+
+def compare(results, previous_results):
+    previous = {result['name']: result for result in previous_results['results']}
+    print('\n{:<40} {:>10} {:>10} {:>14}'.format('Comparison', 'before', 'after', 'queries'))
+    for result in results['results']:
+        if result['name'] not in previous:
+            continue
+        before = previous[result['name']]
+        print('{:<40} {:>10.2f} {:>10.2f} {:>6} -> {:<6}'.format(
+            result['name'], before['median_ms'], result['median_ms'], before['queries'], result['queries']))
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--settings', default=os.environ.get('DJANGO_SETTINGS_MODULE', 'benchmarks.settings'))
+    parser.add_argument('--placeholders', type=int, default=4)
+    parser.add_argument('--depth', type=int, default=3)
+    parser.add_argument('--fan-out', type=int, default=4)
+    parser.add_argument('--languages', type=int, default=1)
+    parser.add_argument('--partials', type=int, default=2)
+    parser.add_argument('--choices', type=int, default=300)
+    parser.add_argument('--repeat', type=int, default=10)
+    parser.add_argument('--output', help='Write the results as JSON to this file.')
+    parser.add_argument('--compare', help='Compare the results with a previous JSON output.')
+    options = parser.parse_args()
+
+    os.environ['DJANGO_SETTINGS_MODULE'] = options.settings
+    django.setup()
+
+    from django.db import connection
+    from django.test.utils import setup_test_environment, teardown_test_environment
+
+    setup_test_environment()
+    old_database_name = connection.settings_dict['NAME']
+    connection.creation.create_test_db(verbosity=0)
+    try:
+        results = run_benchmarks(options)
+    finally:
+        connection.creation.destroy_test_db(old_database_name, verbosity=0)
+        teardown_test_environment()
+
+    if options.compare:
+        with open(options.compare) as previous_file:
+            compare(results, json.load(previous_file))
+
+    if options.output:
+        with open(options.output, 'w') as output_file:
+            json.dump(results, output_file, indent=2)
+
+
+if __name__ == '__main__':
+    main()
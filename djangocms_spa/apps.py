@@ -7,6 +7,9 @@ class DjangoCmsSpaConfig(AppConfig):
     def ready(self):
         from django.forms import CheckboxInput, RadioSelect, Select, SelectMultiple
         from .form_helpers import get_placeholder_for_choices_field, get_serialized_choices_for_field
+        from .receivers import connect_receivers
+
+        connect_receivers()
 
         CheckboxInput.render_spa = lambda self, field, initial=None: {
             'items': get_serialized_choices_for_field(field=field),
@@ -0,0 +1,90 @@
+from asgiref.sync import sync_to_async
+from django.conf import settings
+from django.http import HttpResponse, JsonResponse
+from django.views import View
+
+from .content_helpers import (aget_frontend_data_dict_for_cms_page, aget_frontend_data_dict_for_partials,
+                              get_partial_names_for_template)
+from .decorators import cache_view
+from .json_encoders import dumps
+from .views import CmsPageMixin
+
+
+class AsyncSpaApiView(View):
+    """
+    The async variant of `SpaApiView` for ASGI deployments (Django 4.1+). It is a plain Django view because the REST
+    framework views are synchronous. The ORM bound parts run in a thread, async partial callbacks and post processors
+    are awaited.
+    """
+    template_name = None
+
+    async def get(self, request, *args, **kwargs):
+        data = {
+            'data': await self.aget_fetched_data()
+        }
+
+        partials = await self.aget_partials()
+        if partials:
+            data['partials'] = partials
+
+        response = HttpResponse(
+            content=dumps(data, cls=settings.DJANGOCMS_SPA_JSON_ENCODER),
+            content_type='application/json',
+            status=200
+        )
+
+        if hasattr(settings, 'GIT_COMMIT_HASH'):
+            response['X-App-Version'] = settings.GIT_COMMIT_HASH
+
+        return response
+
+    async def aget_partials(self):
+        partial_names, editable = await sync_to_async(self.get_partial_names_and_editable)()
+        return await aget_frontend_data_dict_for_partials(
+            partials=partial_names,
+            request=self.request,
+            editable=editable,
+        )
+
+    def get_partial_names_and_editable(self):
+        partial_names = get_partial_names_for_template(template=self.get_template_names(), get_all=False,
+                                                       requested_partials=self.request.GET.get('partials'))
+        return partial_names, self.request.user.has_perm('cms.edit_static_placeholder')
+
+    async def aget_fetched_data(self):
+        return await sync_to_async(self.get_fetched_data)()
+
+    def get_fetched_data(self):
+        return {}
+
+    def get_template_names(self):
+        return self.template_name
+
+
+class AsyncCachedSpaApiView(AsyncSpaApiView):
+    add_language_code = True
+    cache_key = None
+
+    @cache_view
+    async def dispatch(self, request, *args, **kwargs):
+        return await super(AsyncCachedSpaApiView, self).dispatch(request, *args, **kwargs)
+
+    def get_cache_key(self):
+        return self.cache_key
+
+
+class AsyncSpaCmsPageDetailApiView(CmsPageMixin, AsyncCachedSpaApiView):
+    async def get(self, request, **kwargs):
+        if not await sync_to_async(self.load_cms_page)(request, path=kwargs.get('path', '')):
+            return JsonResponse(data={}, status=404)
+
+        return await super(AsyncSpaCmsPageDetailApiView, self).get(request, **kwargs)
+
+    async def aget_fetched_data(self):
+        editable = await sync_to_async(self.request.user.has_perm)('cms.change_page')
+        return await aget_frontend_data_dict_for_cms_page(
+            cms_page=self.cms_page,
+            cms_page_title=self.cms_page_title,
+            request=self.request,
+            editable=editable
+        )
@@ -0,0 +1,272 @@
+import threading
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from datetime import datetime, timedelta
+
+from django.conf import settings
+from django.contrib.sites.shortcuts import get_current_site
+from django.core.cache import cache
+from django.core.exceptions import ImproperlyConfigured
+from django.utils import timezone
+
+from .utils import get_django_request
+
+CACHE_KEY_PREFIX = 'djangocms_spa'
+# The version of everything that depends on the page tree (e.g. menus, paths and language links).
+PAGE_TREE_VERSION_KEY = '%s:version:page_tree' % CACHE_KEY_PREFIX
+# The version of the menus, which is bumped by `menu_pool.clear()` (e.g. when attached menus change).
+MENUS_VERSION_KEY = '%s:version:menus' % CACHE_KEY_PREFIX
+# The version of the static placeholders of the process-local pools (see `djangocms_spa.static_placeholder_pool`).
+STATIC_PLACEHOLDERS_VERSION_KEY = '%s:version:static_placeholders' % CACHE_KEY_PREFIX
+
+# Partials and placeholders can be rendered in multiple threads (see `djangocms_spa.executor`) or tasks that share the
+# request.
+_request_state_lock = threading.Lock()
+_collectors = ContextVar('djangocms_spa_cache_dependency_collectors', default=())
+
+
+def get_placeholder_version_key(placeholder_pk):
+    return '{prefix}:version:placeholder:{pk}'.format(prefix=CACHE_KEY_PREFIX, pk=placeholder_pk)
+
+
+def get_placeholder_cache_key(placeholder_pk, language_code, version):
+    return '{prefix}:placeholder:{pk}:{language_code}:{version}'.format(
+        prefix=CACHE_KEY_PREFIX, pk=placeholder_pk, language_code=language_code, version=version)
+
+
+def get_partial_version_key(partial):
+    return '{prefix}:version:partial:{partial}'.format(prefix=CACHE_KEY_PREFIX, partial=partial)
+
+
+def get_partial_cache_key(partial, request, vary_on, version):
+    return '{prefix}:partial:{partial}:{vary_on}:{version}'.format(
+        prefix=CACHE_KEY_PREFIX,
+        partial=partial,
+        vary_on=':'.join(get_vary_on_value(request, dimension) for dimension in vary_on),
+        version=version
+    )
+
+
+def get_vary_on_value(request, dimension):
+    if dimension == 'language':
+        return request.LANGUAGE_CODE
+    if dimension == 'site':
+        return str(get_current_site(request).pk)
+    if dimension == 'user':
+        return str(request.user.pk) if request.user.is_authenticated else 'anonymous'
+    if dimension == 'user_group':
+        if not request.user.is_authenticated:
+            return 'anonymous'
+        group_pks = sorted(request.user.groups.values_list('pk', flat=True))
+        return 'groups-%s' % '-'.join(str(group_pk) for group_pk in group_pks)
+    raise ImproperlyConfigured('Unknown vary on dimension: %s' % dimension)
+
+
+def get_model_version_key(model):
+    # Proxy models share the version of their concrete model.
+    return '{prefix}:version:model:{label}'.format(prefix=CACHE_KEY_PREFIX,
+                                                   label=model._meta.concrete_model._meta.label_lower)
+
+
+def get_object_version_key(model, pk):
+    # Proxy models share the version of their concrete model.
+    return '{prefix}:version:object:{label}:{pk}'.format(prefix=CACHE_KEY_PREFIX,
+                                                         label=model._meta.concrete_model._meta.label_lower, pk=pk)
+
+
+def get_object_cache_key(obj, language_code, version, instance_version=''):
+    return '{prefix}:object:{label}:{pk}:{language_code}:{version}:{instance_version}'.format(
+        prefix=CACHE_KEY_PREFIX,
+        label=obj._meta.concrete_model._meta.label_lower,
+        pk=obj.pk,
+        language_code=language_code,
+        version=version,
+        instance_version=instance_version
+    )
+
+
+def get_initial_version():
+    # Versions start with a timestamp. A version that was evicted from the cache will therefore never come back with a
+    # value that is still referenced by cached data.
+    return int(time.time() * 1000)
+
+
+def get_versions(version_keys):
+    """
+    Returns a dict with the current version of each version key. Missing versions are initialized.
+    """
+    versions = cache.get_many(version_keys)
+    missing_version_keys = [version_key for version_key in version_keys if version_key not in versions]
+
+    if missing_version_keys:
+        initial_version = get_initial_version()
+        for version_key in missing_version_keys:
+            cache.add(version_key, initial_version, None)
+
+        # Another process could have initialized the version in the meantime.
+        versions.update(cache.get_many(missing_version_keys))
+        for version_key in missing_version_keys:
+            versions.setdefault(version_key, initial_version)
+
+    return versions
+
+
+async def aget_versions(version_keys):
+    versions = await cache.aget_many(version_keys)
+    missing_version_keys = [version_key for version_key in version_keys if version_key not in versions]
+
+    if missing_version_keys:
+        initial_version = get_initial_version()
+        for version_key in missing_version_keys:
+            await cache.aadd(version_key, initial_version, None)
+
+        versions.update(await cache.aget_many(missing_version_keys))
+        for version_key in missing_version_keys:
+            versions.setdefault(version_key, initial_version)
+
+    return versions
+
+
+def bump_versions(version_keys):
+    """
+    Invalidates all cached data that depends on one of the given version keys.
+    """
+    for version_key in version_keys:
+        try:
+            cache.incr(version_key)
+        except ValueError:
+            cache.set(version_key, get_initial_version(), None)
+
+
+def bump_existing_versions(version_keys):
+    """
+    Like `bump_versions`, but versions that nobody depends on yet are not initialized.
+    """
+    for version_key in version_keys:
+        try:
+            cache.incr(version_key)
+        except ValueError:
+            pass
+
+
+def add_cache_dependencies(request, versions):
+    """
+    Remembers the versions of the data that is used to render the response of the request. Cached responses are only
+    served as long as all their dependencies are up to date.
+    """
+    django_request = get_django_request(request)
+    with _request_state_lock:
+        if not hasattr(django_request, '_spa_cache_dependencies'):
+            django_request._spa_cache_dependencies = {}
+        django_request._spa_cache_dependencies.update(versions)
+
+    for collected_dependencies in _collectors.get():
+        collected_dependencies.update(versions)
+
+
+def get_cache_dependencies(request):
+    return dict(getattr(get_django_request(request), '_spa_cache_dependencies', {}))
+
+
+@contextmanager
+def collect_cache_dependencies(request):
+    """
+    Collects the dependencies that are added by the current thread or task inside of the block in the yielded dict.
+    They are added to the dependencies of the request as well.
+    """
+    collected_dependencies = {}
+    token = _collectors.set(_collectors.get() + (collected_dependencies,))
+    try:
+        yield collected_dependencies
+    finally:
+        _collectors.reset(token)
+        add_cache_dependencies(request, collected_dependencies)
+
+
+def limit_cache_timeout(request, timeout):
+    """
+    Makes sure that the response of the request is not cached longer than `timeout` seconds (e.g. because it contains
+    a partial with a shorter timeout).
+    """
+    django_request = get_django_request(request)
+    with _request_state_lock:
+        cache_timeout = getattr(django_request, '_spa_cache_timeout', None)
+        if cache_timeout is None or timeout < cache_timeout:
+            django_request._spa_cache_timeout = timeout
+
+
+def get_cache_timeout(request, default_timeout):
+    cache_timeout = getattr(get_django_request(request), '_spa_cache_timeout', None)
+    if cache_timeout is None or (default_timeout is not None and default_timeout < cache_timeout):
+        return default_timeout
+    return cache_timeout
+
+
+def has_current_versions(versions):
+    if not versions:
+        return True
+    return get_versions(list(versions.keys())) == versions
+
+
+async def ahas_current_versions(versions):
+    if not versions:
+        return True
+    return await aget_versions(list(versions.keys())) == versions
+
+
+def use_placeholder_cache(request, editable=False):
+    """
+    Like the response cache, the placeholder cache is only used for anonymous users that can't edit the contents.
+    """
+    if editable or request.user.is_authenticated:
+        return False
+    return bool(settings.DJANGOCMS_SPA_PLACEHOLDER_CACHE_TIMEOUT)
+
+
+def get_placeholder_cache_timeout(plugins, request, placeholder):
+    """
+    Returns how many seconds the data of a placeholder with the given plugin trees can be cached. Like the placeholder
+    cache of the CMS, placeholders with a plugin that disables the cache (`cache = False`) or varies on request headers
+    (`get_vary_cache_on`) are not cached (`0`) and the timeout is limited by the `get_cache_expiration` of each plugin.
+    """
+    cache_timeout = settings.DJANGOCMS_SPA_PLACEHOLDER_CACHE_TIMEOUT
+    for plugin in plugins:
+        try:
+            plugin_class_instance = plugin.get_plugin_class_instance()
+        except KeyError:
+            # Plugins of unknown types are not rendered.
+            continue
+
+        if not plugin_class_instance.cache or plugin_class_instance.get_vary_cache_on(request, plugin, placeholder):
+            return 0
+
+        expiration = plugin_class_instance.get_cache_expiration(request, plugin, placeholder)
+        if isinstance(expiration, datetime):
+            expiration = (expiration - timezone.now()).total_seconds()
+        elif isinstance(expiration, timedelta):
+            expiration = expiration.total_seconds()
+        if expiration is not None:
+            cache_timeout = min(cache_timeout, max(int(expiration), 0))
+
+        child_plugins = getattr(plugin, 'child_plugin_instances', None) or []
+        cache_timeout = min(cache_timeout, get_placeholder_cache_timeout(child_plugins, request, placeholder))
+        if not cache_timeout:
+            return 0
+
+    return cache_timeout
+
+
+def get_placeholder_cache_keys(placeholders, request):
+    """
+    Returns a dict with the placeholder pk as key and the cache key of its current data as value. The placeholder
+    versions are added to the dependencies of the request.
+    """
+    version_keys = {placeholder.pk: get_placeholder_version_key(placeholder.pk) for placeholder in placeholders}
+    versions = get_versions(list(version_keys.values()))
+    add_cache_dependencies(request, versions)
+
+    return {
+        placeholder_pk: get_placeholder_cache_key(placeholder_pk, request.LANGUAGE_CODE, versions[version_key])
+        for placeholder_pk, version_key in version_keys.items()
+    }
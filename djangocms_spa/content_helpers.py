@@ -1,43 +1,68 @@
+import asyncio
+import functools
+from collections import defaultdict
 from urllib.request import url2pathname
 
-from cms.models import StaticPlaceholder
+from asgiref.sync import async_to_sync, sync_to_async
+from cms.models import CMSPlugin
 from django.conf import settings
+from django.core.cache import cache, caches
 
 from djangocms_spa.renderer_pool import renderer_pool
 
-from .utils import get_function_by_path
-
-
-def get_frontend_data_dict_for_cms_page(cms_page, cms_page_title, request, editable=False):
+from .cache import (aget_versions, ahas_current_versions, collect_cache_dependencies, get_partial_cache_key,
+                    get_partial_version_key, get_placeholder_cache_keys, get_placeholder_cache_timeout, get_versions,
+                    has_current_versions, limit_cache_timeout, use_placeholder_cache)
+from .executor import run_concurrently, use_executor
+from .instrumentation import measure, record_cache
+from .json_encoders import StreamedDict, StreamedList
+from .language_links import get_page_language_links
+from .plugin_restrictions import get_allowed_plugins_for_placeholder
+from .static_placeholder_pool import static_placeholder_pool
+from .url_templates import get_placeholder_url_templates
+from .utils import call_async, get_function_by_path
+
+
+def get_frontend_data_dict_for_cms_page(cms_page, cms_page_title, request, editable=False, streamed=False,
+                                        post_process=True):
     """
-    Returns the data dictionary of a CMS page that is used by the frontend.
+    Returns the data dictionary of a CMS page that is used by the frontend. If `streamed` is set, the containers are
+    returned as `StreamedDict` that renders the placeholders while the response is streamed. Without `post_process`
+    the post processors are left to the caller (see `aget_frontend_data_dict_for_cms_page`).
     """
     placeholders = list(cms_page.placeholders.all())
+
+    post_processer = settings.DJANGOCMS_SPA_CMS_PAGE_DATA_POST_PROCESSOR if post_process else None
+    placeholder_post_processer = settings.DJANGOCMS_SPA_PLACEHOLDER_DATA_POST_PROCESSOR if post_process else None
+    if streamed and not post_processer and not placeholder_post_processer:
+        # The post processors need the complete data. This is why we can only stream pages without them.
+        return StreamedDict([
+            ('containers', StreamedDict(iter_frontend_data_for_placeholders(
+                placeholders=placeholders,
+                request=request,
+                editable=editable,
+                streamed=True
+            ))),
+            ('meta', get_meta_data_dict_for_cms_page(cms_page=cms_page, cms_page_title=cms_page_title,
+                                                     request=request)),
+        ])
+
     placeholder_frontend_data_dict = get_frontend_data_dict_for_placeholders(
         placeholders=placeholders,
         request=request,
         editable=editable
     )
-    global_placeholder_data_dict = get_global_placeholder_data(placeholder_frontend_data_dict)
+    global_placeholder_data_dict = {}
+    if placeholder_post_processer:
+        global_placeholder_data_dict = get_global_placeholder_data(placeholder_frontend_data_dict)
     data = {
         'containers': placeholder_frontend_data_dict,
-        'meta': {
-            'title': cms_page_title.page_title if cms_page_title.page_title else cms_page_title.title,
-            'description': cms_page_title.meta_description or '',
-        }
+        'meta': get_meta_data_dict_for_cms_page(cms_page=cms_page, cms_page_title=cms_page_title, request=request)
     }
 
-    language_links = get_language_links(cms_page=cms_page, request=request)
-    if language_links:
-        data['meta']['languages'] = language_links
-
-    if placeholder_frontend_data_dict:
-        data['containers'] = placeholder_frontend_data_dict
-
     if global_placeholder_data_dict:
         data['global_placeholder_data'] = global_placeholder_data_dict
 
-    post_processer = settings.DJANGOCMS_SPA_CMS_PAGE_DATA_POST_PROCESSOR
     if post_processer:
         func = get_function_by_path(post_processer)
         data = func(cms_page=cms_page, data=data, request=request)
@@ -45,60 +70,178 @@ def get_frontend_data_dict_for_cms_page(cms_page, cms_page_title, request, edita
     return data
 
 
+async def aget_frontend_data_dict_for_cms_page(cms_page, cms_page_title, request, editable=False):
+    """
+    The async variant of `get_frontend_data_dict_for_cms_page`. The ORM bound rendering runs in a thread, the post
+    processors are awaited if they are coroutine functions.
+    """
+    data = await sync_to_async(get_frontend_data_dict_for_cms_page)(
+        cms_page=cms_page,
+        cms_page_title=cms_page_title,
+        request=request,
+        editable=editable,
+        post_process=False
+    )
+
+    placeholder_post_processer = settings.DJANGOCMS_SPA_PLACEHOLDER_DATA_POST_PROCESSOR
+    if placeholder_post_processer:
+        global_placeholder_data_dict = await call_async(get_function_by_path(placeholder_post_processer),
+                                                        placeholder_frontend_data_dict=data['containers'])
+        if global_placeholder_data_dict:
+            data['global_placeholder_data'] = global_placeholder_data_dict
+
+    post_processer = settings.DJANGOCMS_SPA_CMS_PAGE_DATA_POST_PROCESSOR
+    if post_processer:
+        data = await call_async(get_function_by_path(post_processer), cms_page=cms_page, data=data, request=request)
+
+    return data
+
+
+def get_meta_data_dict_for_cms_page(cms_page, cms_page_title, request):
+    meta_data = {
+        'title': cms_page_title.page_title if cms_page_title.page_title else cms_page_title.title,
+        'description': cms_page_title.meta_description or '',
+    }
+
+    language_links = get_language_links(cms_page=cms_page, request=request)
+    if language_links:
+        meta_data['languages'] = language_links
+
+    return meta_data
+
+
 def get_frontend_data_dict_for_placeholders(placeholders, request, editable=False):
     """
     Takes a list of placeholder instances and returns the data that is used by the frontend to render all contents.
     The returned dict is grouped by placeholder slots.
     """
-    data_dict = {}
+    with measure(request, 'placeholders'):
+        return dict(iter_frontend_data_for_placeholders(placeholders=placeholders, request=request,
+                                                        editable=editable))
+
+
+def iter_frontend_data_for_placeholders(placeholders, request, editable=False, streamed=False):
+    """
+    Yields the slot and the data of each placeholder. If `streamed` is set, the plugins of placeholders that are not
+    cached are yielded as `StreamedList` and rendered one root plugin at a time while the data is encoded.
+    """
+    placeholders = [placeholder for placeholder in placeholders if placeholder]
+
+    # The data of each placeholder is cached with a version that is bumped whenever one of its plugins changes.
+    # Placeholders with plugins that can't be cached (see `get_placeholder_cache_timeout`) are rendered every time.
+    placeholder_cache_keys = {}
+    cached_placeholder_data = {}
+    if use_placeholder_cache(request=request, editable=editable):
+        placeholder_cache_keys = get_placeholder_cache_keys(placeholders=placeholders, request=request)
+        cached_data = cache.get_many(list(placeholder_cache_keys.values()))
+        cached_placeholder_data = {placeholder_pk: cached_data[cache_key]
+                                   for placeholder_pk, cache_key in placeholder_cache_keys.items()
+                                   if cache_key in cached_data}
+        record_cache(request, 'placeholder', hits=len(cached_placeholder_data),
+                     misses=len(placeholder_cache_keys) - len(cached_placeholder_data))
+
+    plugin_trees = get_plugin_trees_for_placeholders(
+        placeholders=[placeholder for placeholder in placeholders if placeholder.pk not in cached_placeholder_data],
+        language=request.LANGUAGE_CODE
+    )
+
+    # Unless the response is streamed, the plugins of the placeholders are rendered concurrently if
+    # `DJANGOCMS_SPA_RENDER_THREADS` is set.
+    rendered_plugins = {}
+    rendered_placeholders = [placeholder for placeholder in placeholders if plugin_trees.get(placeholder.pk)]
+    if not streamed and use_executor(len(rendered_placeholders)):
+        rendered_plugins = dict(zip([placeholder.pk for placeholder in rendered_placeholders], run_concurrently([
+            functools.partial(get_frontend_data_for_plugins, plugin_trees[placeholder.pk], request=request,
+                              editable=editable, placeholder=placeholder)
+            for placeholder in rendered_placeholders
+        ])))
+
+    placeholder_data_by_cache_timeout = {}
     for placeholder in placeholders:
-        if placeholder:
+        if placeholder.pk in cached_placeholder_data:
+            if cached_placeholder_data[placeholder.pk]:
+                yield placeholder.slot, cached_placeholder_data[placeholder.pk]
+            continue
+
+        # We don't use the helper method `placeholder.get_plugins()` because of the wrong order by path. We need the
+        # complete cascading structure of the plugins in the frontend. The tree loader returns the root plugins of
+        # each placeholder with their children attached.
+        plugins = rendered_plugins.get(placeholder.pk)
+        if plugins is None:
             plugins = []
+            plugin_data = iter_frontend_data_for_plugins(plugin_trees[placeholder.pk], request=request,
+                                                         editable=editable, rendered_plugins=plugins)
+            if not streamed:
+                with measure(request, 'placeholder.%s' % placeholder.slot):
+                    list(plugin_data)
+
+        placeholder_data = {}
+        if plugin_trees[placeholder.pk] or editable:
+            placeholder_data = {
+                'type': 'cmp-%s' % placeholder.slot,
+                'plugins': plugins,
+            }
+
+        if editable:
+            # This is the structure of the template `cms/toolbar/placeholder.html` that is used to register
+            # the frontend editing.
+            allowed_plugins = get_allowed_plugins_for_placeholder(request=request, placeholder=placeholder)
+            url_templates = get_placeholder_url_templates(placeholder)
+
+            placeholder_data['cms'] = [
+                'cms-placeholder-{}'.format(placeholder.pk),
+                {
+                    'type': 'placeholder',
+                    'name': str(placeholder.get_label()),
+                    'page_language': request.LANGUAGE_CODE,
+                    'placeholder_id': placeholder.pk,
+                    'plugin_language': request.LANGUAGE_CODE,
+                    'plugin_restriction': [module for module in allowed_plugins],
+                    'addPluginHelpTitle': 'Add plugin to placeholder {}'.format(placeholder.get_label()),
+                    'urls': {
+                        'add_plugin': url_templates['add_plugin'],
+                        'copy_plugin': url_templates['copy_plugin']
+                    }
+                }
+            ]
+
+        if placeholder_data:
+            if streamed:
+                # The list of rendered plugins is complete as soon as the streamed placeholder data is encoded.
+                yield placeholder.slot, StreamedDict(
+                    (key, StreamedList(plugin_data) if key == 'plugins' else value)
+                    for key, value in placeholder_data.items()
+                )
+            else:
+                yield placeholder.slot, placeholder_data
 
-            # We don't use the helper method `placeholder.get_plugins()` because of the wrong order by path. We need the
-            # complete cascading structure of the plugins in the frontend. This is why we ignore the children here and
-            # add them later in the loop.
-            placeholder_plugins = placeholder.cmsplugin_set.filter(language=request.LANGUAGE_CODE, parent__isnull=True).order_by(
-                settings.DJANGOCMS_SPA_PLUGIN_ORDER_FIELD)
+        if placeholder.pk in placeholder_cache_keys:
+            cache_timeout = get_placeholder_cache_timeout(plugin_trees[placeholder.pk], request=request,
+                                                          placeholder=placeholder)
+            if cache_timeout:
+                placeholder_data_by_cache_timeout.setdefault(cache_timeout, {})[
+                    placeholder_cache_keys[placeholder.pk]] = placeholder_data
 
-            for plugin in placeholder_plugins:
-                plugins.append(get_frontend_data_dict_for_plugin(
-                    request=request,
-                    plugin=plugin,
-                    editable=editable)
-                )
+    for cache_timeout, placeholder_data_by_cache_key in placeholder_data_by_cache_timeout.items():
+        cache.set_many(placeholder_data_by_cache_key, cache_timeout)
 
-            if plugins or editable:
-                data_dict[placeholder.slot] = {
-                    'type': 'cmp-%s' % placeholder.slot,
-                    'plugins': plugins,
-                }
 
-            if editable:
-                # This is the structure of the template `cms/toolbar/placeholder.html` that is used to register
-                # the frontend editing.
-                from cms.plugin_pool import plugin_pool
-                plugin_types = [cls.__name__ for cls in plugin_pool.get_all_plugins(placeholder.slot, placeholder.page)]
-                allowed_plugins = plugin_types + plugin_pool.get_system_plugins()
-
-                data_dict[placeholder.slot]['cms'] = [
-                    'cms-placeholder-{}'.format(placeholder.pk),
-                    {
-                        'type': 'placeholder',
-                        'name': str(placeholder.get_label()),
-                        'page_language': request.LANGUAGE_CODE,
-                        'placeholder_id': placeholder.pk,
-                        'plugin_language': request.LANGUAGE_CODE,
-                        'plugin_restriction': [module for module in allowed_plugins],
-                        'addPluginHelpTitle': 'Add plugin to placeholder {}'.format(placeholder.get_label()),
-                        'urls': {
-                            'add_plugin': placeholder.get_add_url(),
-                            'copy_plugin': placeholder.get_copy_url()
-                        }
-                    }
-                ]
+def get_frontend_data_for_plugins(plugins, request, editable, placeholder):
+    rendered_plugins = []
+    with measure(request, 'placeholder.%s' % placeholder.slot):
+        list(iter_frontend_data_for_plugins(plugins, request=request, editable=editable,
+                                            rendered_plugins=rendered_plugins))
+    return rendered_plugins
 
-    return data_dict
+
+def iter_frontend_data_for_plugins(plugins, request, editable, rendered_plugins):
+    """
+    Yields the data of each plugin and appends it to `rendered_plugins`.
+    """
+    for plugin in plugins:
+        plugin_data = get_frontend_data_dict_for_plugin(request=request, plugin=plugin, editable=editable)
+        rendered_plugins.append(plugin_data)
+        yield plugin_data
 
 
 def get_frontend_data_dict_for_plugin(request, plugin, editable):
@@ -106,6 +249,11 @@ def get_frontend_data_dict_for_plugin(request, plugin, editable):
     Returns a serializable data dict of a CMS plugin and all its children. It expects a `render_json_plugin()` method
     from each plugin. Make sure you implement it for your custom plugins and monkey patch all third-party plugins.
     """
+    with measure(request, 'plugin.%s' % plugin.plugin_type):
+        return _get_frontend_data_dict_for_plugin(request=request, plugin=plugin, editable=editable)
+
+
+def _get_frontend_data_dict_for_plugin(request, plugin, editable):
     json_data = {}
     instance, plugin = plugin.get_plugin_instance()
 
@@ -118,7 +266,13 @@ def get_frontend_data_dict_for_plugin(request, plugin, editable):
 
     if hasattr(plugin, 'parse_child_plugins') and plugin.parse_child_plugins:
         children = json_data.get('plugins', [])
-        for child_plugin in instance.get_children().order_by(settings.DJANGOCMS_SPA_PLUGIN_ORDER_FIELD):
+
+        # Plugins loaded by `get_plugin_trees_for_placeholders` already know their children.
+        child_plugins = getattr(instance, 'child_plugin_instances', None)
+        if child_plugins is None:
+            child_plugins = instance.get_children().order_by(settings.DJANGOCMS_SPA_PLUGIN_ORDER_FIELD)
+
+        for child_plugin in child_plugins:
             # Parse all children
             children.append(
                 get_frontend_data_dict_for_plugin(
@@ -134,6 +288,67 @@ def get_frontend_data_dict_for_plugin(request, plugin, editable):
     return json_data
 
 
+def get_plugin_trees_for_placeholders(placeholders, language):
+    """
+    Loads the plugins of all given placeholders with a single query and downcasts them with one bulk query per plugin
+    type. Returns a dict with the placeholder pk as key and a list of its root plugins as value. The children of each
+    plugin are attached as `child_plugin_instances`. All lists are ordered by `DJANGOCMS_SPA_PLUGIN_ORDER_FIELD`.
+    """
+    from cms.plugin_pool import plugin_pool
+
+    placeholders_by_pk = {placeholder.pk: placeholder for placeholder in placeholders if placeholder}
+    plugin_trees = {placeholder_pk: [] for placeholder_pk in placeholders_by_pk.keys()}
+    if not placeholders_by_pk:
+        return plugin_trees
+
+    plugins = list(CMSPlugin.objects.filter(placeholder_id__in=list(placeholders_by_pk), language=language).order_by(
+        settings.DJANGOCMS_SPA_PLUGIN_ORDER_FIELD))
+
+    plugin_pks_by_type = defaultdict(list)
+    for plugin in plugins:
+        plugin_pks_by_type[plugin.plugin_type].append(plugin.pk)
+
+    bound_plugins = {}
+    for plugin_type, plugin_pks in plugin_pks_by_type.items():
+        try:
+            plugin_class = plugin_pool.get_plugin(plugin_type)
+        except KeyError:
+            # Unknown plugin types are left to `get_plugin_instance()` like before.
+            continue
+
+        if plugin_class.model is CMSPlugin:
+            continue
+
+        # Plugins without a row in the table of their model stay unbound (like `get_plugin_instance()` handles them).
+        bound_plugins.update(dict.fromkeys(plugin_pks))
+        for instance in plugin_class.get_render_queryset().filter(pk__in=plugin_pks):
+            bound_plugins[instance.pk] = instance
+
+    tree_plugins = {}
+    for plugin in plugins:
+        instance = bound_plugins.get(plugin.pk, plugin)
+        if instance is None:
+            # Prevent `get_bound_plugin()` from querying the missing row again.
+            plugin._inst = None
+            instance = plugin
+
+        instance.placeholder = placeholders_by_pk[instance.placeholder_id]
+        instance.child_plugin_instances = []
+        tree_plugins[instance.pk] = instance
+
+    # The parent of a plugin is not guaranteed to be ordered before its children, that's why we need a second loop.
+    for plugin in plugins:
+        instance = tree_plugins[plugin.pk]
+        if not instance.parent_id:
+            plugin_trees[instance.placeholder_id].append(instance)
+        elif instance.parent_id in tree_plugins:
+            parent = tree_plugins[instance.parent_id]
+            instance.parent = parent
+            parent.child_plugin_instances.append(instance)
+
+    return plugin_trees
+
+
 def get_partial_names_for_template(template=None, get_all=True, requested_partials=None):
     template = template or settings.DJANGOCMS_SPA_DEFAULT_TEMPLATE
 
@@ -158,6 +373,27 @@ def get_partial_names_for_template(template=None, get_all=True, requested_partia
         return [partial for partial in partials if partial in requested_partials]
 
 
+def get_all_partial_names():
+    partial_names = []
+    for template_settings in settings.DJANGOCMS_SPA_TEMPLATES.values():
+        for partial in template_settings.get('partials', []):
+            if partial not in partial_names:
+                partial_names.append(partial)
+    return partial_names
+
+
+def parse_partial_versions(versions):
+    """
+    Parses the partial versions that a client holds (e.g. `menu:5d41402a,footer:7d793037`) into a dict.
+    """
+    partial_versions = {}
+    for partial_version in url2pathname(versions or '').split(','):
+        partial, separator, version = partial_version.rpartition(':')
+        if separator:
+            partial_versions[partial] = version
+    return partial_versions
+
+
 def get_frontend_data_dict_for_partials(partials, request, editable=False, renderer=None):
     """
     We call global page elements that are used to render a template `partial`. The contents of a partial do not
@@ -178,38 +414,173 @@ def get_frontend_data_dict_for_partials(partials, request, editable=False, rende
         else:
             static_placeholder_names.append(partial)
 
-    # Get the data of all static placeholders
-    use_static_placeholder_draft = (hasattr(request, 'toolbar') and request.toolbar.edit_mode_active and
-                                    request.user.has_perm('cms.edit_static_placeholder'))
-    static_placeholders = []
-    for static_placeholder_name in static_placeholder_names:
-        static_placeholders.append(get_static_placeholder(static_placeholder_name, use_static_placeholder_draft))
+    # The static placeholders and each partial that has a custom callback are independent of each other. They are
+    # rendered concurrently if `DJANGOCMS_SPA_RENDER_THREADS` is set.
+    functions = [functools.partial(get_frontend_data_dict_for_static_placeholders,
+                                   static_placeholder_names=static_placeholder_names, request=request,
+                                   editable=editable)]
+    functions += [functools.partial(get_frontend_data_for_partial_callback, partial=partial_settings_key,
+                                    request=request, editable=editable, renderer=renderer)
+                  for partial_settings_key in custom_callback_partials]
+    with measure(request, 'partials'):
+        results = run_concurrently(functions)
+
+    partial_data = results[0]
+    partial_data.update(zip(custom_callback_partials, results[1:]))
+    return partial_data
+
 
-    partial_data = get_frontend_data_dict_for_placeholders(
+async def aget_frontend_data_dict_for_partials(partials, request, editable=False, renderer=None):
+    """
+    The async variant of `get_frontend_data_dict_for_partials`. The static placeholders are rendered in a thread while
+    the partial callbacks are awaited concurrently.
+    """
+    static_placeholder_names = [partial for partial in partials
+                                if partial not in settings.DJANGOCMS_SPA_PARTIAL_CALLBACKS.keys()]
+    custom_callback_partials = [partial for partial in partials
+                                if partial in settings.DJANGOCMS_SPA_PARTIAL_CALLBACKS.keys()]
+
+    results = await asyncio.gather(
+        sync_to_async(get_frontend_data_dict_for_static_placeholders)(
+            static_placeholder_names=static_placeholder_names, request=request, editable=editable),
+        *[aget_frontend_data_for_partial_callback(partial=partial_settings_key, request=request, editable=editable,
+                                                  renderer=renderer)
+          for partial_settings_key in custom_callback_partials]
+    )
+
+    partial_data = results[0]
+    partial_data.update(zip(custom_callback_partials, results[1:]))
+    return partial_data
+
+
+def get_frontend_data_dict_for_static_placeholders(static_placeholder_names, request, editable=False):
+    # Missing static placeholders are only created in the edit mode.
+    edit_mode_active = hasattr(request, 'toolbar') and request.toolbar.edit_mode_active
+    use_static_placeholder_draft = edit_mode_active and request.user.has_perm('cms.edit_static_placeholder')
+    static_placeholders = get_static_placeholders(static_placeholder_names, use_static_placeholder_draft,
+                                                  create_missing=edit_mode_active)
+
+    return get_frontend_data_dict_for_placeholders(
         placeholders=static_placeholders,
         request=request,
         editable=editable
     )
 
-    # Get the data of all partials that have a custom callback.
-    for partial_settings_key in custom_callback_partials:
-        dotted_function_module_path = settings.DJANGOCMS_SPA_PARTIAL_CALLBACKS[partial_settings_key]
-        callback_function = get_function_by_path(dotted_function_module_path)
-        partial_data[partial_settings_key] = callback_function(request, renderer)
 
-    return partial_data
+def get_partial_callback_settings(partial):
+    """
+    A partial callback is either configured by its module path or by a dict with the keys `callback`, `cache_timeout`,
+    `cache_alias` and `vary_on`.
+    """
+    partial_callback = settings.DJANGOCMS_SPA_PARTIAL_CALLBACKS[partial]
+    if isinstance(partial_callback, str):
+        partial_callback = {'callback': partial_callback}
+
+    return {
+        'callback': partial_callback['callback'],
+        'cache_timeout': partial_callback.get('cache_timeout', 0),
+        'cache_alias': partial_callback.get('cache_alias', 'default'),
+        'vary_on': partial_callback.get('vary_on', ('language', 'site')),
+    }
+
+
+def get_frontend_data_for_partial_callback(partial, request, editable=False, renderer=None):
+    """
+    Returns the data of a partial callback. If the partial has a `cache_timeout`, its data is served from its own
+    cache and the callback is only called when the data is missing, expired or one of its dependencies changed.
+    """
+    with measure(request, 'partial.%s' % partial):
+        return _get_frontend_data_for_partial_callback(partial=partial, request=request, editable=editable,
+                                                       renderer=renderer)
+
+
+def _get_frontend_data_for_partial_callback(partial, request, editable=False, renderer=None):
+    partial_settings = get_partial_callback_settings(partial)
+    callback_function = get_function_by_path(partial_settings['callback'])
+    if asyncio.iscoroutinefunction(callback_function):
+        callback_function = async_to_sync(callback_function)
+
+    cache_timeout = partial_settings['cache_timeout']
+    if cache_timeout == 0 or editable:
+        return callback_function(request, renderer)
+
+    # The response that contains this partial must not outlive it.
+    if cache_timeout is not None:
+        limit_cache_timeout(request, cache_timeout)
+
+    version_key = get_partial_version_key(partial)
+    versions = get_versions([version_key])
+    partial_cache = caches[partial_settings['cache_alias']]
+    cache_key = get_partial_cache_key(partial, request, partial_settings['vary_on'], versions[version_key])
+
+    with collect_cache_dependencies(request) as dependencies:
+        dependencies.update(versions)
+        cache_entry = partial_cache.get(cache_key)
+        if isinstance(cache_entry, dict) and has_current_versions(cache_entry['dependencies']):
+            dependencies.update(cache_entry['dependencies'])
+            record_cache(request, 'partial', hits=1)
+            return cache_entry['data']
+
+        record_cache(request, 'partial', misses=1)
+        data = callback_function(request, renderer)
+
+    partial_cache.set(cache_key, {'data': data, 'dependencies': dependencies}, cache_timeout)
+    return data
 
 
-def get_static_placeholder(static_placeholder_slot_name, get_draft_data=False):
-    static_placeholder = StaticPlaceholder.objects.get_or_create(
-        code=static_placeholder_slot_name,
-        defaults={'creation_method': StaticPlaceholder.CREATION_BY_TEMPLATE}
-    )[0]
+async def aget_frontend_data_for_partial_callback(partial, request, editable=False, renderer=None):
+    """
+    The async variant of `get_frontend_data_for_partial_callback`. Synchronous callbacks run in a thread.
+    """
+    partial_settings = get_partial_callback_settings(partial)
+    callback_function = get_function_by_path(partial_settings['callback'])
+    if not asyncio.iscoroutinefunction(callback_function):
+        return await sync_to_async(get_frontend_data_for_partial_callback)(
+            partial=partial, request=request, editable=editable, renderer=renderer)
+
+    cache_timeout = partial_settings['cache_timeout']
+    if cache_timeout == 0 or editable:
+        return await callback_function(request, renderer)
+
+    if cache_timeout is not None:
+        limit_cache_timeout(request, cache_timeout)
+
+    version_key = get_partial_version_key(partial)
+    versions = await aget_versions([version_key])
+    partial_cache = caches[partial_settings['cache_alias']]
+    # The vary on values can depend on the database (e.g. the site or the groups of the user).
+    cache_key = await sync_to_async(get_partial_cache_key)(partial, request, partial_settings['vary_on'],
+                                                           versions[version_key])
+
+    with collect_cache_dependencies(request) as dependencies:
+        dependencies.update(versions)
+        cache_entry = await partial_cache.aget(cache_key)
+        if isinstance(cache_entry, dict) and await ahas_current_versions(cache_entry['dependencies']):
+            dependencies.update(cache_entry['dependencies'])
+            return cache_entry['data']
+
+        data = await callback_function(request, renderer)
+
+    await partial_cache.aset(cache_key, {'data': data, 'dependencies': dependencies}, cache_timeout)
+    return data
 
-    if get_draft_data:
-        return static_placeholder.draft
-    else:
-        return static_placeholder.public
+
+def get_static_placeholders(static_placeholder_slot_names, get_draft_data=False, create_missing=False):
+    static_placeholders = static_placeholder_pool.get_static_placeholders(static_placeholder_slot_names,
+                                                                          create_missing=create_missing)
+    placeholders = []
+    for static_placeholder in static_placeholders:
+        if not static_placeholder:
+            placeholders.append(None)
+        elif get_draft_data:
+            placeholders.append(static_placeholder.draft)
+        else:
+            placeholders.append(static_placeholder.public)
+    return placeholders
+
+
+def get_static_placeholder(static_placeholder_slot_name, get_draft_data=False, create_missing=False):
+    return get_static_placeholders([static_placeholder_slot_name], get_draft_data, create_missing)[0]
 
 
 def get_global_placeholder_data(placeholder_frontend_data_dict):
@@ -227,7 +598,4 @@ def get_global_placeholder_data(placeholder_frontend_data_dict):
 
 
 def get_language_links(cms_page, request):
-    language_links = {}
-    for language_code, language in settings.LANGUAGES:
-        language_links[language_code] = cms_page.get_absolute_url(language=language_code)
-    return language_links
+    return get_page_language_links(cms_page)
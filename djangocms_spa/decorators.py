@@ -1,45 +1,320 @@
+import asyncio
+import hashlib
+import time
 from functools import wraps
+from typing import TYPE_CHECKING
 
+from asgiref.sync import sync_to_async
 from django.conf import settings
 from django.core.cache import cache
+from django.http import HttpResponse, HttpResponseNotModified
 from django.template.response import ContentNotRenderedError
+from django.utils.http import parse_etags, quote_etag
+
+from .cache import ahas_current_versions, get_cache_dependencies, get_cache_timeout, has_current_versions
+from .instrumentation import measure, record_cache
+
+if TYPE_CHECKING:
+    from .async_views import AsyncCachedSpaApiView
 
 
 def cache_view(view_func):
+    """
+    Caches the responses of anonymous users. Coroutine functions (e.g. the `dispatch` method of the async views) get
+    an async wrapper that uses the async cache API.
+    """
+    if asyncio.iscoroutinefunction(view_func):
+        return async_cache_view(view_func)
+
     @wraps(view_func)
     def _wrapped_view_func(view: 'CachedApiView', *args, **kwargs):
         request = view.request
+        cache_key = get_view_cache_key(view)
 
-        cache_key = view.get_cache_key()
-        if not cache_key:
-            cache_key = request.get_full_path()
+        lock_acquired = False
+        if not request.user.is_authenticated:
+            with measure(request, 'cache'):
+                cached_entry = get_cache_entry(cache_key, with_body=not is_conditional(request))
+                cached_response = get_response_for_cache_entry(request, cache_key, cached_entry)
+            if cached_response and not is_stale(cached_entry):
+                record_cache(request, 'response', hits=1)
+                return cached_response
+            record_cache(request, 'response', misses=1)
 
-        if view.add_language_code:
-            try:
-                language_code = request.LANGUAGE_CODE
-            except AttributeError:
-                language_code = settings.LANGUAGE_CODE
-            cache_key += ':%s' % language_code
+            # Only one worker renders a stale or missing response. The others get the stale response or wait for the
+            # new one (if `DJANGOCMS_SPA_CACHE_SINGLE_FLIGHT` is active).
+            if cached_response or settings.DJANGOCMS_SPA_CACHE_SINGLE_FLIGHT:
+                lock_acquired = acquire_cache_lock(cache_key)
+                if not lock_acquired:
+                    cached_response = cached_response or wait_for_cached_response(request, cache_key)
+                    if cached_response:
+                        return cached_response
 
-        cached_response = cache.get(cache_key)
+        try:
+            response = view_func(view, *args, **kwargs)
 
-        if cached_response and not request.user.is_authenticated:
-            return cached_response
+            if response.status_code == 200 and not response.streaming and not request.user.is_authenticated:
+                dependencies = get_cache_dependencies(view.request)
+                timeout = get_cache_timeout(view.request, settings.DJANGOCMS_SPA_CACHE_TIMEOUT)
+                try:
+                    set_cache_after_rendering(cache_key, response, timeout, dependencies)
+                except ContentNotRenderedError:
+                    response.add_post_render_callback(
+                        lambda r: set_cache_after_rendering(cache_key, r, timeout, dependencies)
+                    )
+                else:
+                    if is_not_modified(request, response['ETag']):
+                        return get_not_modified_response(response['ETag'])
+        finally:
+            if lock_acquired:
+                release_cache_lock(cache_key)
 
-        response = view_func(view, *args, **kwargs)
+        return response
+
+    return _wrapped_view_func
 
-        if response.status_code == 200 and not request.user.is_authenticated:
-            try:
-                set_cache_after_rendering(cache_key, response, settings.DJANGOCMS_SPA_CACHE_TIMEOUT)
-            except ContentNotRenderedError:
-                response.add_post_render_callback(
-                    lambda r: set_cache_after_rendering(cache_key, r, settings.DJANGOCMS_SPA_CACHE_TIMEOUT)
-                )
+
+def async_cache_view(view_func):
+    @wraps(view_func)
+    async def _wrapped_view_func(view: 'AsyncCachedSpaApiView', *args, **kwargs):
+        request = view.request
+        cache_key = get_view_cache_key(view)
+
+        # Loading the user of the session queries the database.
+        is_anonymous = not await sync_to_async(lambda: request.user.is_authenticated)()
+
+        lock_acquired = False
+        if is_anonymous:
+            cached_entry = await aget_cache_entry(cache_key, with_body=not is_conditional(request))
+            cached_response = await aget_response_for_cache_entry(request, cache_key, cached_entry)
+            if cached_response and not is_stale(cached_entry):
+                return cached_response
+
+            if cached_response or settings.DJANGOCMS_SPA_CACHE_SINGLE_FLIGHT:
+                lock_acquired = await cache.aadd(get_cache_lock_key(cache_key), True,
+                                                 settings.DJANGOCMS_SPA_CACHE_LOCK_TIMEOUT)
+                if not lock_acquired:
+                    cached_response = cached_response or await await_cached_response(request, cache_key)
+                    if cached_response:
+                        return cached_response
+
+        try:
+            response = await view_func(view, *args, **kwargs)
+
+            if response.status_code == 200 and not response.streaming and is_anonymous:
+                timeout = get_cache_timeout(view.request, settings.DJANGOCMS_SPA_CACHE_TIMEOUT)
+                cache_entries = get_cache_entries_for_response(cache_key, response, timeout,
+                                                               get_cache_dependencies(view.request))
+                await cache.aset_many(cache_entries, get_cache_entry_timeout(timeout))
+                if is_not_modified(request, response['ETag']):
+                    return get_not_modified_response(response['ETag'])
+        finally:
+            if lock_acquired:
+                await cache.adelete(get_cache_lock_key(cache_key))
 
         return response
 
     return _wrapped_view_func
 
 
-def set_cache_after_rendering(cache_key, response, timeout):
-    cache.set(cache_key, response, timeout)
+def get_view_cache_key(view):
+    cache_key = view.get_cache_key()
+    if not cache_key:
+        cache_key = view.request.get_full_path()
+
+    if view.add_language_code:
+        try:
+            language_code = view.request.LANGUAGE_CODE
+        except AttributeError:
+            language_code = settings.LANGUAGE_CODE
+        cache_key += ':%s' % language_code
+
+    return cache_key
+
+
+def set_cache_after_rendering(cache_key, response, timeout, dependencies=None):
+    """
+    Stores the rendered content and the headers of the response instead of the pickled response object. The ETag,
+    the expiry and the dependencies are stored in a separate small entry to answer conditional requests without
+    loading the content.
+
+    The entry is fresh for `timeout` seconds. After that, it is served for `DJANGOCMS_SPA_CACHE_STALE_TIMEOUT` more
+    seconds while a single worker renders the new response.
+    """
+    cache_entries = get_cache_entries_for_response(cache_key, response, timeout, dependencies)
+    cache.set_many(cache_entries, get_cache_entry_timeout(timeout))
+
+
+def get_cache_entries_for_response(cache_key, response, timeout, dependencies=None):
+    """
+    Returns the entry with the ETag, the expiry and the dependencies of the response and the entry with its body by
+    cache key.
+    """
+    dependencies = dependencies or {}
+    response['ETag'] = get_etag(response)
+    return {
+        cache_key: {
+            'etag': response['ETag'],
+            'dependencies': dependencies,
+            'expires': time.time() + timeout if timeout is not None else None,
+        },
+        get_body_cache_key(cache_key): {
+            'etag': response['ETag'],
+            'content': response.content,
+            'status': response.status_code,
+            'headers': list(response.items()),
+        },
+    }
+
+
+def get_body_cache_key(cache_key):
+    return '%s:body' % cache_key
+
+
+def get_cache_entry_timeout(timeout):
+    if timeout is None:
+        return None
+    return timeout + settings.DJANGOCMS_SPA_CACHE_STALE_TIMEOUT
+
+
+def get_cache_entry(cache_key, with_body=False):
+    """
+    Returns the cached entry of a response as long as all versions it was rendered from are unchanged. With
+    `with_body`, the body is loaded in the same round trip and added to the entry as `body`.
+    """
+    if not with_body:
+        return get_current_cache_entry(cache.get(cache_key))
+
+    cache_entries = cache.get_many([cache_key, get_body_cache_key(cache_key)])
+    return get_current_cache_entry(cache_entries.get(cache_key), cache_entries.get(get_body_cache_key(cache_key)))
+
+
+async def aget_cache_entry(cache_key, with_body=False):
+    if not with_body:
+        cache_entry = await cache.aget(cache_key)
+        body = None
+    else:
+        cache_entries = await cache.aget_many([cache_key, get_body_cache_key(cache_key)])
+        cache_entry = cache_entries.get(cache_key)
+        body = cache_entries.get(get_body_cache_key(cache_key))
+
+    if isinstance(cache_entry, dict) and await ahas_current_versions(cache_entry['dependencies']):
+        return dict(cache_entry, body=body)
+    return None
+
+
+def get_current_cache_entry(cache_entry, body=None):
+    if isinstance(cache_entry, dict) and has_current_versions(cache_entry['dependencies']):
+        return dict(cache_entry, body=body)
+    return None
+
+
+def is_stale(cache_entry):
+    expires = cache_entry.get('expires', 0)
+    return expires is not None and expires <= time.time()
+
+
+def acquire_cache_lock(cache_key):
+    # `add` only sets the key if it doesn't exist yet. This is atomic in the locmem backend and a best effort in
+    # backends like the file based cache, which is good enough to prevent a stampede.
+    return cache.add(get_cache_lock_key(cache_key), True, settings.DJANGOCMS_SPA_CACHE_LOCK_TIMEOUT)
+
+
+def release_cache_lock(cache_key):
+    cache.delete(get_cache_lock_key(cache_key))
+
+
+def get_cache_lock_key(cache_key):
+    return '%s:lock' % cache_key
+
+
+def wait_for_cached_response(request, cache_key):
+    """
+    Waits up to `DJANGOCMS_SPA_CACHE_LOCK_WAIT` seconds for the worker that holds the lock to cache its response.
+    """
+    deadline = time.time() + settings.DJANGOCMS_SPA_CACHE_LOCK_WAIT
+    while time.time() < deadline:
+        time.sleep(0.05)
+        cache_entry = get_cache_entry(cache_key, with_body=not is_conditional(request))
+        cached_response = get_response_for_cache_entry(request, cache_key, cache_entry)
+        if cached_response:
+            return cached_response
+    return None
+
+
+async def await_cached_response(request, cache_key):
+    deadline = time.time() + settings.DJANGOCMS_SPA_CACHE_LOCK_WAIT
+    while time.time() < deadline:
+        await asyncio.sleep(0.05)
+        cache_entry = await aget_cache_entry(cache_key, with_body=not is_conditional(request))
+        cached_response = await aget_response_for_cache_entry(request, cache_key, cache_entry)
+        if cached_response:
+            return cached_response
+    return None
+
+
+def get_response_for_cache_entry(request, cache_key, cache_entry):
+    """
+    Returns a `304 Not Modified` response if the client has the current version of the cached response. The body is
+    only loaded (unless it was loaded with the entry) if the complete response must be sent. Returns `None` if there
+    is no cached response.
+    """
+    if not cache_entry:
+        return None
+    if is_not_modified(request, cache_entry['etag']):
+        return get_not_modified_response(cache_entry['etag'])
+
+    body = cache_entry['body'] or cache.get(get_body_cache_key(cache_key))
+    return get_response_from_body(cache_entry, body)
+
+
+async def aget_response_for_cache_entry(request, cache_key, cache_entry):
+    if not cache_entry:
+        return None
+    if is_not_modified(request, cache_entry['etag']):
+        return get_not_modified_response(cache_entry['etag'])
+
+    body = cache_entry['body'] or await cache.aget(get_body_cache_key(cache_key))
+    return get_response_from_body(cache_entry, body)
+
+
+def get_response_from_body(cache_entry, body):
+    # The body belongs to another version of the response if it was stored by a concurrent worker or evicted.
+    if not isinstance(body, dict) or body['etag'] != cache_entry['etag']:
+        return None
+
+    response = HttpResponse(content=body['content'], status=body['status'])
+    for header, value in body['headers']:
+        response[header] = value
+    return response
+
+
+def get_etag(response):
+    """
+    Returns a strong ETag that is derived from the content of the response. A response that is rendered again with the
+    same content (e.g. after the cache entry expired) keeps its ETag, so clients with a valid copy still get a
+    `304 Not Modified` response.
+    """
+    return quote_etag(get_content_version(response.content))
+
+
+def get_content_version(content):
+    return hashlib.md5(content).hexdigest()
+
+
+def is_conditional(request):
+    return bool(request.META.get('HTTP_IF_NONE_MATCH'))
+
+
+def is_not_modified(request, etag):
+    if not is_conditional(request):
+        return False
+
+    etags = parse_etags(request.META['HTTP_IF_NONE_MATCH'])
+    return '*' in etags or etag in etags
+
+
+def get_not_modified_response(etag):
+    response = HttpResponseNotModified()
+    response['ETag'] = etag
+    return response
@@ -0,0 +1,64 @@
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+from django.conf import settings
+from django.db import close_old_connections
+from django.urls import get_script_prefix, get_urlconf, set_script_prefix, set_urlconf
+from django.utils import translation
+
+_executor = None
+_executor_lock = threading.Lock()
+_worker = threading.local()
+
+
+def get_executor():
+    """
+    Returns the process-local thread pool. It is only created if `DJANGOCMS_SPA_RENDER_THREADS` is set.
+    """
+    global _executor
+    if _executor is None:
+        with _executor_lock:
+            if _executor is None:
+                _executor = ThreadPoolExecutor(max_workers=settings.DJANGOCMS_SPA_RENDER_THREADS,
+                                               thread_name_prefix='djangocms_spa')
+    return _executor
+
+
+def use_executor(number_of_functions):
+    # Functions that already run in a worker are not distributed again. A worker that waits for other workers of the
+    # same bounded pool could deadlock it.
+    if getattr(_worker, 'active', False):
+        return False
+    return bool(settings.DJANGOCMS_SPA_RENDER_THREADS and number_of_functions > 1)
+
+
+def run_concurrently(functions):
+    """
+    Calls each function in the thread pool and returns their results in the order of the functions. Exceptions are
+    raised in the calling thread. Without `DJANGOCMS_SPA_RENDER_THREADS` the functions are called one after another.
+    """
+    if not use_executor(len(functions)):
+        return [function() for function in functions]
+
+    # The language, the urlconf and the script prefix are thread-local. Every worker uses the ones of the caller.
+    context = (translation.get_language(), get_urlconf(), get_script_prefix())
+    futures = [get_executor().submit(call_in_worker, function, context) for function in functions]
+    return [future.result() for future in futures]
+
+
+def call_in_worker(function, context):
+    language_code, urlconf, script_prefix = context
+
+    # Each worker thread has its own database connections. They are closed like the ones of a request thread when
+    # they are unusable or exceeded `CONN_MAX_AGE`.
+    close_old_connections()
+    _worker.active = True
+    set_urlconf(urlconf)
+    set_script_prefix(script_prefix)
+    try:
+        with translation.override(language_code):
+            return function()
+    finally:
+        _worker.active = False
+        set_urlconf(None)
+        close_old_connections()
@@ -1,4 +1,18 @@
+from django.conf import settings
+from django.core import signing
+from django.db.models import Q
+from django.forms import ModelChoiceField
+from django.urls import reverse
+
+CHOICES_SIGNING_SALT = 'djangocms_spa.form_choices'
+
+_choices_models = (None, frozenset())
+
+
 def get_placeholder_for_choices_field(field):
+    if use_lazy_choices(field):
+        return str(getattr(field, 'empty_label', None) or '---------')
+
     choices = get_choices_for_field(field)
     for choice in choices:
         label = str(choice[1])
@@ -10,7 +24,13 @@ def get_placeholder_for_choices_field(field):
 
 
 def get_serialized_choices_for_field(field):
-    choices = get_choices_for_field(field)
+    # Lazy choices are loaded from the choices endpoint (see `get_choices_url`).
+    if use_lazy_choices(field):
+        return []
+    return get_serialized_choices(get_choices_for_field(field))
+
+
+def get_serialized_choices(choices):
     serialized_choices = []
 
     for choice in choices:
@@ -34,3 +54,86 @@ def get_choices_for_field(field):
             return field.widget.choices
         except AttributeError:
             return []
+
+
+def use_lazy_choices(field):
+    """
+    Returns whether the choices of a field are loaded from the choices endpoint instead of being rendered inline. The
+    endpoint is public and returns the choices of the form class, that's why each field has to opt in with the
+    `spa_lazy_choices` widget attribute.
+    """
+    return bool(field.widget.attrs.get('spa_lazy_choices'))
+
+
+def get_choices_models():
+    """
+    Returns the (concrete) models of the model choice fields of all `SpaApiForm` and `SpaApiModelForm` classes whose
+    choices are compiled (`compile_spa_schema`) or can be loaded lazily. Only changes of these models invalidate the
+    compiled schemas and the choices endpoint. The models are collected again as soon as new form classes are defined.
+    """
+    global _choices_models
+
+    from .forms import SpaApiForm, SpaApiModelForm
+
+    form_classes = set()
+    pending_form_classes = [SpaApiForm, SpaApiModelForm]
+    while pending_form_classes:
+        form_class = pending_form_classes.pop()
+        form_classes.add(form_class)
+        pending_form_classes.extend(form_class.__subclasses__())
+
+    registry_key = frozenset(form_classes)
+    if _choices_models[0] == registry_key:
+        return _choices_models[1]
+
+    models = set()
+    for form_class in form_classes:
+        for field in form_class.base_fields.values():
+            if not isinstance(field, ModelChoiceField):
+                continue
+            if use_lazy_choices(field) or getattr(form_class, 'compile_spa_schema', False):
+                models.add(field.queryset.model._meta.concrete_model)
+
+    _choices_models = (registry_key, frozenset(models))
+    return _choices_models[1]
+
+
+def get_choices_url(form_class, field_name):
+    """
+    Returns the url of the choices endpoint for a field of a form class. The field is referenced by a signed value,
+    so only fields of forms that were rendered can be requested.
+    """
+    form_path = '.'.join([form_class.__module__, form_class.__name__])
+    return '{url}?field={field}'.format(
+        url=reverse('djangocms_spa:form_choices'),
+        field=signing.dumps([form_path, field_name], salt=CHOICES_SIGNING_SALT)
+    )
+
+
+def get_choices_page(field, query='', page=1):
+    """
+    Returns the serialized choices of a page and whether there is a next page. The choices are filtered by the prefix
+    `query`. Model choice fields with `spa_search_fields` in the widget attributes are filtered and paginated in the
+    database.
+    """
+    page_size = settings.DJANGOCMS_SPA_LAZY_CHOICES_PAGE_SIZE
+    offset = (page - 1) * page_size
+    search_fields = field.widget.attrs.get('spa_search_fields')
+
+    if isinstance(field, ModelChoiceField) and (search_fields or not query):
+        queryset = field.queryset
+        if query:
+            search_filter = Q()
+            for search_field in search_fields:
+                search_filter |= Q(**{'%s__istartswith' % search_field: query})
+            queryset = queryset.filter(search_filter)
+
+        choices = [(field.prepare_value(obj), field.label_from_instance(obj))
+                   for obj in queryset[offset:offset + page_size + 1]]
+    else:
+        query = query.lower()
+        choices = [choice for choice in get_choices_for_field(field)
+                   if str(choice[0]) and str(choice[1]).lower().startswith(query)]
+        choices = choices[offset:offset + page_size + 1]
+
+    return get_serialized_choices(choices[:page_size]), len(choices) > page_size
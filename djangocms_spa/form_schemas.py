@@ -0,0 +1,46 @@
+from django.forms import ModelChoiceField
+from django.utils.translation import get_language
+
+from .cache import get_model_version_key, get_versions
+
+
+class FormSchemaPool(object):
+    """
+    A process-local registry of the compiled field schemas of forms with `compile_spa_schema = True`. The static parts
+    of each field (component, type, label, placeholder, choices and `spa_attrs`) are computed once per form class and
+    language. Schemas with model choices are compiled with the shared version of the model, so every process compiles
+    them again as soon as an object of the model was saved or deleted.
+    """
+
+    def __init__(self):
+        self.schemas = {}
+
+    def get_field_schema(self, form, name, compile_field_schema):
+        schema_key = (type(form), get_language())
+        if schema_key not in self.schemas:
+            self.schemas[schema_key] = {}
+
+        field_schemas = self.schemas[schema_key]
+        version = self.get_model_versions(form).get(name)
+        if name not in field_schemas or field_schemas[name][0] != version:
+            field_schemas[name] = (version, compile_field_schema())
+
+        return field_schemas[name][1]
+
+    def get_model_versions(self, form):
+        """
+        Returns the version of the model of each model choice field of the form. The versions are loaded once per form
+        instance.
+        """
+        if not hasattr(form, '_spa_model_versions'):
+            version_keys = {name: get_model_version_key(field.queryset.model) for name, field in form.fields.items()
+                            if isinstance(field, ModelChoiceField)}
+            versions = get_versions(list(set(version_keys.values()))) if version_keys else {}
+            form._spa_model_versions = {name: versions[version_key] for name, version_key in version_keys.items()}
+        return form._spa_model_versions
+
+    def clear(self):
+        self.schemas = {}
+
+
+form_schema_pool = FormSchemaPool()
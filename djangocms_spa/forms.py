@@ -1,4 +1,3 @@
-import requests
 import six
 from django.conf import settings
 from django.core.exceptions import ValidationError
@@ -6,6 +5,7 @@ from django.forms import ALL_FIELDS, BaseModelForm, forms
 from django.forms.models import ModelFormMetaclass
 from django.utils.translation import gettext_lazy as _
 
+from .recaptcha import get_recaptcha_verifier
 from .renderer import SPAFormFieldWidgetRenderer
 
 DEFAULT_VALIDATION_ERROR = _('Invalid data')
@@ -15,6 +15,9 @@ SUBMIT_BUTTON_LABEL = _('Submit')
 
 class SpaApiForm(forms.Form):
     api_url = ''
+    # Compiles the static parts of the fields once per form class and language. Only use it if the fields don't change
+    # per instance (e.g. a queryset that depends on the user).
+    compile_spa_schema = False
     default_validation_error = DEFAULT_VALIDATION_ERROR
     submit_button_label = SUBMIT_BUTTON_LABEL
     show_general_error_message = True
@@ -109,8 +112,10 @@ class ReCaptchaFormMixin(object):
         super(ReCaptchaFormMixin, self).__init__(*args, **kwargs)
 
     def clean(self):
-        if settings.RECAPTCHA_IS_ACTIVE:
+        # The token can only be verified once, so the result is kept for repeated validations of the same form.
+        if settings.RECAPTCHA_IS_ACTIVE and not getattr(self, '_recaptcha_verified', False):
             self.verify()
+            self._recaptcha_verified = True
         return super(ReCaptchaFormMixin, self).clean()
 
     def verify(self):
@@ -124,19 +129,8 @@ class ReCaptchaFormMixin(object):
         except:
             raise ValidationError(self.invalid_recaptcha)
 
-        response = requests.post(
-            url=settings.RECAPTCHA_URL,
-            data={
-                'secret': settings.RECAPTCHA_SECRET_KEY,
-                'response': recaptcha_form_value,
-                'remoteip': remote_ip
-            }
-        )
-
-        if response.status_code == 200:
-            response_json_data = response.json()
-            if response_json_data.get('success'):
-                return True
+        if get_recaptcha_verifier().verify(recaptcha_form_value, remote_ip=remote_ip):
+            return True
 
         raise ValidationError(self.invalid_recaptcha)
 
@@ -148,6 +142,7 @@ class ReCaptchaFormMixin(object):
 
 
 class SpaApiModelForm(six.with_metaclass(ModelFormMetaclass, BaseModelForm)):
+    compile_spa_schema = False
     default_validation_error = DEFAULT_VALIDATION_ERROR
     no_cookie_message = NO_COOKIE_MESSAGE
     submit_button_label = SUBMIT_BUTTON_LABEL
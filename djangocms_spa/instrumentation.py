@@ -0,0 +1,118 @@
+import re
+import threading
+import time
+from contextlib import ExitStack, contextmanager, nullcontext
+from functools import wraps
+
+from django.conf import settings
+from django.db import connections
+
+from .signals import request_instrumented
+from .utils import get_django_request
+
+NO_MEASUREMENT = nullcontext()
+
+
+class Instrumentation(object):
+    """
+    Collects the wall time and the number of queries of each stage (e.g. `placeholder.main` or `plugin.TextPlugin`)
+    and the cache hits and misses of a request. Stages are inclusive: the time of a plugin contains the time of its
+    children. Queries are counted in the request thread only.
+    """
+
+    def __init__(self):
+        self.queries = 0
+        self.timings = {}
+        self.cache = {}
+        self.lock = threading.Lock()
+
+    def count_query(self, execute, sql, params, many, context):
+        self.queries += 1
+        return execute(sql, params, many, context)
+
+    @contextmanager
+    def measure(self, name):
+        start_time = time.perf_counter()
+        start_queries = self.queries
+        try:
+            yield
+        finally:
+            duration = (time.perf_counter() - start_time) * 1000
+            with self.lock:
+                timing = self.timings.setdefault(name, {'duration': 0.0, 'queries': 0, 'count': 0})
+                timing['duration'] += duration
+                timing['queries'] += self.queries - start_queries
+                timing['count'] += 1
+
+    def record_cache(self, name, hits=0, misses=0):
+        with self.lock:
+            cache = self.cache.setdefault(name, {'hits': 0, 'misses': 0})
+            cache['hits'] += hits
+            cache['misses'] += misses
+
+    def get_server_timing(self):
+        metrics = []
+        for name, timing in self.timings.items():
+            metrics.append('{name};dur={duration:.2f};desc="count={count} queries={queries}"'.format(
+                name=get_metric_name(name), **timing))
+        for name, cache in self.cache.items():
+            metrics.append('cache.{name};desc="hits={hits} misses={misses}"'.format(name=get_metric_name(name),
+                                                                                    **cache))
+        return ', '.join(metrics)
+
+
+def get_metric_name(name):
+    # Metric names of the `Server-Timing` header are tokens.
+    return re.sub(r'[^\w.!#$%&\'*+^`|~-]', '-', name)
+
+
+def get_instrumentation(request):
+    return getattr(get_django_request(request), '_spa_instrumentation', None)
+
+
+def measure(request, name):
+    """
+    Measures the stage `name` of the request. Without `DJANGOCMS_SPA_INSTRUMENTATION` this returns a shared no-op
+    context manager.
+    """
+    instrumentation = get_instrumentation(request)
+    if instrumentation is None:
+        return NO_MEASUREMENT
+    return instrumentation.measure(name)
+
+
+def record_cache(request, name, hits=0, misses=0):
+    instrumentation = get_instrumentation(request)
+    if instrumentation is not None:
+        instrumentation.record_cache(name, hits=hits, misses=misses)
+
+
+def instrument_view(view_func):
+    """
+    Instruments a view method if `DJANGOCMS_SPA_INSTRUMENTATION` is set. The measurements are added to the response as
+    `Server-Timing` header and sent with the `request_instrumented` signal. Nested instrumented methods are measured as
+    part of the outermost one.
+    """
+    @wraps(view_func)
+    def _wrapped_view_func(view, request, *args, **kwargs):
+        django_request = get_django_request(request)
+        if not settings.DJANGOCMS_SPA_INSTRUMENTATION or hasattr(django_request, '_spa_instrumentation'):
+            return view_func(view, request, *args, **kwargs)
+
+        instrumentation = Instrumentation()
+        django_request._spa_instrumentation = instrumentation
+        with ExitStack() as stack:
+            for connection in connections.all():
+                stack.enter_context(connection.execute_wrapper(instrumentation.count_query))
+            with instrumentation.measure('view'):
+                response = view_func(view, request, *args, **kwargs)
+
+        server_timing = instrumentation.get_server_timing()
+        if server_timing:
+            response['Server-Timing'] = server_timing
+
+        request_instrumented.send(sender=view.__class__, request=django_request, response=response,
+                                  timings=instrumentation.timings, cache=instrumentation.cache)
+        return response
+
+    return _wrapped_view_func
@@ -1,11 +1,170 @@
 import json
+import uuid
+from collections import UserDict, UserList
 
+from django.core.exceptions import ImproperlyConfigured
 from django.utils.encoding import force_str
 from django.utils.functional import Promise
 
+JSON_BACKENDS = ('orjson', 'ujson', 'json')
+
 
 class LazyJSONEncoder(json.JSONEncoder):
     def default(self, o):
         if isinstance(o, Promise):
             return force_str(o)
+        if isinstance(o, uuid.UUID):
+            return str(o)
+        if isinstance(o, UserList):
+            return list(o)
+        if isinstance(o, UserDict):
+            return dict(o)
         return super().default(o=o)
+
+
+def dumps(o, cls=LazyJSONEncoder, backend=None):
+    """
+    Returns the JSON of `o` as UTF-8 encoded bytes. The `backend` (default: `DJANGOCMS_SPA_JSON_BACKEND`) is one of
+    `orjson`, `ujson`, `json` or `auto`, which uses the fastest installed library. Types that the backend doesn't
+    know (e.g. lazy translations) are converted by the `default` method of the encoder class `cls`. All backends
+    encode the same values, but only `json` returns the same bytes as `json.dumps` (orjson and ujson return compact
+    output without escaping non-ASCII characters).
+    """
+    return get_json_backend(backend)(o, cls)
+
+
+def get_json_backend(backend=None):
+    if backend is None:
+        from django.conf import settings
+        backend = settings.DJANGOCMS_SPA_JSON_BACKEND
+
+    if backend == 'auto':
+        for backend in JSON_BACKENDS:
+            try:
+                return _get_json_backend(backend)
+            except ImportError:
+                pass
+
+    if backend not in JSON_BACKENDS:
+        raise ImproperlyConfigured('Unknown JSON backend: %s' % backend)
+
+    return _get_json_backend(backend)
+
+
+def _get_json_backend(backend):
+    if backend == 'orjson':
+        import orjson
+
+        # Subclasses of the JSON types are passed to `default` as well. orjson would encode the (empty) list of
+        # `ErrorList`, which keeps its items in `UserList.data`.
+        option = orjson.OPT_NON_STR_KEYS | orjson.OPT_PASSTHROUGH_DATETIME
+        option |= orjson.OPT_PASSTHROUGH_DATACLASS | orjson.OPT_PASSTHROUGH_SUBCLASS
+        return lambda o, cls: orjson.dumps(o, default=get_default(cls), option=option)
+
+    if backend == 'ujson':
+        import ujson
+
+        return lambda o, cls: ujson.dumps(resolve_for_json(o, get_default(cls)), ensure_ascii=False,
+                                          escape_forward_slashes=False).encode('utf-8')
+
+    return lambda o, cls: json.dumps(o, cls=cls).encode('utf-8')
+
+
+def get_default(cls):
+    """
+    Returns the `default` function of the encoder class `cls` for orjson and ujson. Subclasses of the JSON types (e.g.
+    `ErrorList`, `SafeString` or `OrderedDict`) are converted to the plain types like the stdlib encoder sees them.
+    Types that the stdlib encoder doesn't know either are converted by `cls().default`.
+    """
+    default = cls().default
+
+    def _default(o):
+        if isinstance(o, str):
+            # `str(o)` would return `SafeString` itself.
+            return str.__str__(o)
+        if isinstance(o, int) and not isinstance(o, bool):
+            return int(o)
+        if isinstance(o, float):
+            return float(o)
+        if isinstance(o, (list, tuple, UserList)):
+            return list(o)
+        if isinstance(o, (dict, UserDict)):
+            return dict(o)
+        return default(o)
+
+    return _default
+
+
+def resolve_for_json(o, default):
+    """
+    Returns a copy of `o` that only contains JSON types. All other values are converted by `default` like the
+    `json.JSONEncoder` does it.
+    """
+    if type(o) in (str, int, float, bool) or o is None:
+        return o
+    if type(o) is dict:
+        return {key: resolve_for_json(value, default) for key, value in o.items()}
+    if type(o) in (list, tuple):
+        return [resolve_for_json(value, default) for value in o]
+    return resolve_for_json(default(o), default)
+
+
+class StreamedList(object):
+    """
+    An iterable that is encoded as JSON array by `iterencode_streamed` without being materialized first.
+    """
+
+    def __init__(self, iterable):
+        self.iterable = iterable
+
+    def __iter__(self):
+        return iter(self.iterable)
+
+
+class StreamedDict(StreamedList):
+    """
+    An iterable of `(key, value)` pairs that is encoded as JSON object by `iterencode_streamed`.
+    """
+
+
+def iterencode_streamed(o, encoder):
+    """
+    Yields the JSON chunks of `o`. Streamed values are consumed lazily, all other values are encoded at once. Streamed
+    values can only be nested inside of other streamed values.
+    """
+    if isinstance(o, StreamedDict):
+        yield '{'
+        for index, (key, value) in enumerate(o):
+            if index:
+                yield encoder.item_separator
+            yield encoder.encode(key) + encoder.key_separator
+            yield from iterencode_streamed(value, encoder)
+        yield '}'
+    elif isinstance(o, StreamedList):
+        yield '['
+        for index, value in enumerate(o):
+            if index:
+                yield encoder.item_separator
+            yield from iterencode_streamed(value, encoder)
+        yield ']'
+    else:
+        yield encoder.encode(o)
+
+
+def stream_json(o, cls=LazyJSONEncoder, chunk_size=8192):
+    """
+    Yields the JSON of `o` in chunks of about `chunk_size` characters. The output is identical to `dumps` with the
+    `json` backend.
+    """
+    chunks = []
+    buffered_size = 0
+    for chunk in iterencode_streamed(o, cls()):
+        chunks.append(chunk)
+        buffered_size += len(chunk)
+        if buffered_size >= chunk_size:
+            yield ''.join(chunks)
+            chunks = []
+            buffered_size = 0
+
+    if chunks:
+        yield ''.join(chunks)
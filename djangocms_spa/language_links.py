@@ -0,0 +1,74 @@
+from functools import lru_cache
+
+from cms.models.titlemodels import EmptyTitle
+from django.conf import settings
+from django.core.cache import cache
+from django.urls import NoReverseMatch, get_urlconf, reverse
+from django.utils import translation
+
+from .cache import CACHE_KEY_PREFIX, PAGE_TREE_VERSION_KEY, get_versions
+
+
+def get_page_language_links(cms_page):
+    """
+    Returns the url of the page in each language of `LANGUAGES`. The links are cached per page for
+    `DJANGOCMS_SPA_PAGE_PATH_CACHE_TIMEOUT` seconds or until the page tree changes (which includes all changes of
+    titles and paths).
+    """
+    versions = get_versions([PAGE_TREE_VERSION_KEY])
+    cache_key = '{prefix}:language_links:{pk}:{urlconf}:{version}'.format(
+        prefix=CACHE_KEY_PREFIX,
+        pk=cms_page.pk,
+        urlconf=get_urlconf() or '',
+        version=versions[PAGE_TREE_VERSION_KEY]
+    )
+
+    language_links = cache.get(cache_key)
+    if language_links is None:
+        load_titles(cms_page)
+        language_links = {}
+        for language_code, language in settings.LANGUAGES:
+            language_links[language_code] = cms_page.get_absolute_url(language=language_code)
+        cache.set(cache_key, language_links, settings.DJANGOCMS_SPA_PAGE_PATH_CACHE_TIMEOUT)
+
+    return language_links
+
+
+def load_titles(cms_page):
+    """
+    Loads all titles of the page with a single query into the title cache of the page. Languages without a title are
+    cached as `EmptyTitle`, so the page falls back to another language without querying the titles again.
+    """
+    cms_page.title_cache.update({title.language: title for title in cms_page.title_set.all()})
+    for language_code, language in settings.LANGUAGES:
+        cms_page.title_cache.setdefault(language_code, EmptyTitle(language_code))
+
+
+def get_translated_urls(url_name, args=None, kwargs=None, exclude_language_code=None):
+    """
+    Returns the url of a url name with its arguments in every language of `LANGUAGES` (except
+    `exclude_language_code`). The urls are cached for the process per urlconf until the page tree changes (apphooks
+    add their urls to the paths of their pages).
+    """
+    versions = get_versions([PAGE_TREE_VERSION_KEY])
+    translated_urls = _get_translated_urls(url_name, tuple(args or ()), tuple(sorted((kwargs or {}).items())),
+                                           get_urlconf(), versions[PAGE_TREE_VERSION_KEY])
+    return {language_code: url for language_code, url in translated_urls if language_code != exclude_language_code}
+
+
+@lru_cache(maxsize=10000)
+def _get_translated_urls(url_name, args, kwargs, urlconf, version):
+    translated_urls = []
+    for language_code, language in settings.LANGUAGES:
+        # `override` restores the active language of the thread, even if `reverse` fails.
+        with translation.override(language_code):
+            try:
+                translated_urls.append((language_code, reverse(url_name, urlconf=urlconf, args=args,
+                                                               kwargs=dict(kwargs))))
+            except NoReverseMatch:
+                pass
+    return tuple(translated_urls)
+
+
+def clear_translated_urls():
+    _get_translated_urls.cache_clear()
@@ -0,0 +1,28 @@
+import time
+
+from django.core.management.base import BaseCommand
+
+from djangocms_spa.tasks import process_outbox_tasks
+
+
+class Command(BaseCommand):
+    help = 'Executes the due tasks of the outbox (see `djangocms_spa.tasks.OutboxTaskBackend`).'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--limit', type=int, default=100,
+                            help='Maximum number of tasks that are executed at once.')
+        parser.add_argument('--loop', action='store_true',
+                            help='Keep processing the outbox instead of processing it once.')
+        parser.add_argument('--interval', type=float, default=1,
+                            help='Seconds to wait between two runs if the outbox is empty (with --loop).')
+
+    def handle(self, *args, **options):
+        while True:
+            number_of_tasks = process_outbox_tasks(limit=options['limit'])
+            if options['verbosity'] > 1 and number_of_tasks:
+                self.stdout.write('Executed %s tasks.' % number_of_tasks)
+
+            if not options['loop']:
+                break
+            if number_of_tasks < options['limit']:
+                time.sleep(options['interval'])
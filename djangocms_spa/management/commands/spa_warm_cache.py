@@ -0,0 +1,115 @@
+import asyncio
+from itertools import combinations
+from multiprocessing import Pool
+
+from asgiref.sync import async_to_sync
+from cms.models import Title
+from django.conf import settings
+from django.contrib.auth.models import AnonymousUser
+from django.core.cache import cache
+from django.core.management.base import BaseCommand
+from django.db import connections
+from django.test import RequestFactory
+from django.urls import resolve, reverse
+from django.utils import timezone, translation
+
+from djangocms_spa.cache import CACHE_KEY_PREFIX
+from djangocms_spa.content_helpers import get_partial_names_for_template
+
+LAST_RUN_CACHE_KEY = '%s:warm_cache:last_run' % CACHE_KEY_PREFIX
+
+
+def warm_url(language_code, url):
+    """
+    Renders the url with the view it resolves to (e.g. a subclass of `SpaCmsPageDetailApiView`) like an anonymous
+    request. The view stores the response with the same cache key as a real request.
+    """
+    request = RequestFactory().get(url)
+    request.user = AnonymousUser()
+    request.LANGUAGE_CODE = language_code
+
+    with translation.override(language_code):
+        request.resolver_match = resolve(request.path_info)
+        view = request.resolver_match.func
+        if asyncio.iscoroutinefunction(view):
+            view = async_to_sync(view)
+        response = view(request, *request.resolver_match.args, **request.resolver_match.kwargs)
+
+    return url, response.status_code
+
+
+def warm_url_in_pool(args):
+    return warm_url(*args)
+
+
+def get_page_api_url(path, url_namespace='djangocms_spa'):
+    if path:
+        return reverse('%s:cms_page_detail' % url_namespace, kwargs={'path': path})
+    return reverse('%s:cms_page_detail_home' % url_namespace)
+
+
+class Command(BaseCommand):
+    help = 'Renders all published CMS pages in all languages to fill the cache of the page API.'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--processes', type=int, default=1,
+                            help='Number of worker processes. Only useful with a cache backend that is shared by '
+                                 'all processes.')
+        parser.add_argument('--incremental', action='store_true',
+                            help='Only warm pages that were changed since the last run.')
+        parser.add_argument('--url-namespace', default='djangocms_spa',
+                            help='The namespace of the page API urls.')
+        parser.add_argument('--all-partial-combinations', action='store_true',
+                            help='Warm every combination of the partials of a template instead of no and all '
+                                 'partials.')
+
+    def handle(self, *args, **options):
+        started = timezone.now()
+        titles = Title.objects.filter(published=True, publisher_is_draft=False).select_related('page')
+
+        last_run = cache.get(LAST_RUN_CACHE_KEY)
+        if options['incremental'] and last_run:
+            titles = titles.filter(page__changed_date__gt=last_run)
+
+        language_codes = [language_code for language_code, language in settings.LANGUAGES]
+        urls = []
+        for title in titles.filter(language__in=language_codes):
+            with translation.override(title.language):
+                page_api_url = get_page_api_url(title.path, options['url_namespace'])
+
+            for partials in self.get_partial_combinations(title.page.get_template(),
+                                                          options['all_partial_combinations']):
+                url = page_api_url
+                if partials:
+                    url += '?partials=%s' % ','.join(partials)
+                urls.append((title.language, url))
+
+        if options['processes'] > 1:
+            # The workers must not share the database connections of this process.
+            connections.close_all()
+            with Pool(processes=options['processes']) as pool:
+                results = pool.imap_unordered(warm_url_in_pool, urls)
+                self.report(results)
+        else:
+            self.report(warm_url(*args) for args in urls)
+
+        cache.set(LAST_RUN_CACHE_KEY, started, None)
+
+    def get_partial_combinations(self, template, all_partial_combinations=False):
+        partials = get_partial_names_for_template(template=template)
+        if not all_partial_combinations:
+            return [[], partials] if partials else [[]]
+
+        partial_combinations = []
+        for length in range(len(partials) + 1):
+            partial_combinations.extend(list(combination) for combination in combinations(partials, length))
+        return partial_combinations
+
+    def report(self, results):
+        warmed_urls = 0
+        for url, status_code in results:
+            if status_code == 200:
+                warmed_urls += 1
+            else:
+                self.stderr.write('%s returned status %s' % (url, status_code))
+        self.stdout.write('Warmed %s urls.' % warmed_urls)
@@ -0,0 +1,29 @@
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    initial = True
+
+    dependencies = []
+
+    operations = [
+        migrations.CreateModel(
+            name='SpaTask',
+            fields=[
+                ('id', models.AutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('function_path', models.CharField(max_length=255, verbose_name='function path')),
+                ('kwargs', models.TextField(default='{}', verbose_name='keyword arguments')),
+                ('run_at', models.DateTimeField(db_index=True, verbose_name='run at')),
+                ('attempts', models.PositiveIntegerField(default=0, verbose_name='attempts')),
+                ('failed', models.BooleanField(default=False, verbose_name='failed')),
+                ('last_error', models.TextField(blank=True, verbose_name='last error')),
+                ('created_at', models.DateTimeField(auto_now_add=True, verbose_name='created at')),
+            ],
+            options={
+                'verbose_name': 'task',
+                'verbose_name_plural': 'tasks',
+                'ordering': ('run_at',),
+            },
+        ),
+    ]
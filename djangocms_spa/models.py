@@ -1,11 +1,15 @@
 from appconf import AppConf
+from cms import cms_menus
+from cms.utils.conf import get_cms_setting
 from cms.utils.urlutils import admin_reverse
-from django.urls import reverse
 from django.db import models
 from django.utils.translation import gettext_lazy as _
-from menus.menu_pool import MenuRenderer
+from menus.menu_pool import MenuPool, MenuRenderer
 
+from djangocms_spa.cache import MENUS_VERSION_KEY, bump_versions
 from djangocms_spa.json_encoders import LazyJSONEncoder
+from djangocms_spa.partial_callbacks import build_all_menu_nodes
+from djangocms_spa.url_templates import get_url
 
 
 class DjangoCmsSPAConf(AppConf):
@@ -17,7 +21,21 @@ class DjangoCmsSPAConf(AppConf):
         }
     }
     CACHE_TIMEOUT = 60 * 10
+    # Stale responses are served for this many seconds after `CACHE_TIMEOUT` while a single worker renders them again.
+    CACHE_STALE_TIMEOUT = 0
+    # Requests for missing responses wait for the worker that renders them instead of rendering them themselves.
+    CACHE_SINGLE_FLIGHT = False
+    CACHE_LOCK_TIMEOUT = 30
+    CACHE_LOCK_WAIT = 5
+    # The rendered data of each placeholder is cached until one of its plugins changes. `0` disables it.
+    PLACEHOLDER_CACHE_TIMEOUT = 0
+    # The page and title of each path (or the fact that there is no page) are cached until the page tree changes.
+    PAGE_PATH_CACHE_TIMEOUT = 60 * 60 * 24
+    # The detail data of the objects of `SpaDetailApiView` is cached until the object changes. Changes of related
+    # objects are not tracked, so it is disabled (`0`) by default.
+    OBJECT_CACHE_TIMEOUT = 0
     DEFAULT_LIST_CONTAINER_NAME = 'object_list'
+    STREAMING_RESPONSE = False
     CMS_PAGE_DATA_POST_PROCESSOR = None
     PLACEHOLDER_DATA_POST_PROCESSOR = None
     # The CMS used the `position` field to order plugins until treebeard was introduced and a `path` field was added.
@@ -25,7 +43,36 @@ class DjangoCmsSPAConf(AppConf):
     # this is changed in the future.
     PLUGIN_ORDER_FIELD = 'position'
     PARTIAL_CALLBACKS = {}
+    # The number of threads that render partials and placeholders concurrently. `0` renders them one after another.
+    RENDER_THREADS = 0
+    # The menu partial is cached until the page tree changes or the menus are cleared (like the menus of the CMS).
+    # Set it to `0` to disable it.
+    MENU_CACHE_TIMEOUT = get_cms_setting('CACHE_DURATIONS')['menus']
+    # Adds the time, queries and cache hits of each rendering stage as `Server-Timing` header to the API responses.
+    INSTRUMENTATION = False
+    # The plugin restrictions of the edit mode are cached per `'request'` or per `'process'`.
+    PLUGIN_RESTRICTION_CACHE = 'request'
     JSON_ENCODER = LazyJSONEncoder
+    # `auto` uses the fastest installed library of `orjson`, `ujson` and `json`.
+    JSON_BACKEND = 'json'
+    LAZY_CHOICES_PAGE_SIZE = 50
+    # Use `djangocms_spa.recaptcha.StubReCaptchaVerifier` in tests and benchmarks.
+    RECAPTCHA_VERIFIER = 'djangocms_spa.recaptcha.ReCaptchaVerifier'
+    RECAPTCHA_CONNECT_TIMEOUT = 3
+    RECAPTCHA_READ_TIMEOUT = 5
+    RECAPTCHA_RETRIES = 2
+    RECAPTCHA_POOL_SIZE = 10
+    RECAPTCHA_CIRCUIT_BREAKER_THRESHOLD = 5
+    RECAPTCHA_CIRCUIT_BREAKER_TIMEOUT = 30
+    # Verified tokens are rejected without a request for this many seconds (tokens expire after 2 minutes).
+    RECAPTCHA_TOKEN_CACHE_TIMEOUT = 60 * 2
+    # The tasks of `SpaFormApiView.get_post_save_tasks` are executed in a thread pool or (with
+    # `djangocms_spa.tasks.OutboxTaskBackend`) by the `spa_process_tasks` management command.
+    TASK_BACKEND = 'djangocms_spa.tasks.ThreadPoolTaskBackend'
+    TASK_THREADS = 2
+    TASK_RETRIES = 3
+    TASK_RETRY_DELAY = 1
+    TASK_LEASE_TIMEOUT = 60 * 5
     COMPONENT_PREFIX = 'dyn-'
     COMPONENT_NAMES = {}
 
@@ -81,21 +128,42 @@ class DjangoCmsMixin(models.Model):
                     'onClose': 'REFRESH_PAGE',
                     'addPluginHelpTitle': '%s %s' % (_('Add plugin to'), self._meta.verbose_name),
                     'urls': {
-                        'add_plugin': admin_reverse('cms_page_add_plugin'),
+                        'add_plugin': get_url('cms_page_add_plugin', reverse_function=admin_reverse),
                         'edit_plugin': '{url}?language={language_code}'.format(
-                            url=reverse(
-                                'admin:%s_%s_change' % (self._meta.app_label, self._meta.model_name), args=(self.pk,)),
+                            url=get_url('admin:%s_%s_change' % (self._meta.app_label, self._meta.model_name),
+                                        pk=self.pk),
                             language_code=request.LANGUAGE_CODE
                         ),
-                        'move_plugin': admin_reverse('cms_page_move_plugin'),
-                        'delete_plugin': admin_reverse('cms_page_delete_plugin', args=(self.pk,)),
-                        'copy_plugin': admin_reverse('cms_page_copy_plugins')
+                        'move_plugin': get_url('cms_page_move_plugin', reverse_function=admin_reverse),
+                        'delete_plugin': get_url('cms_page_delete_plugin', pk=self.pk, reverse_function=admin_reverse),
+                        'copy_plugin': get_url('cms_page_copy_plugins', reverse_function=admin_reverse)
                     }
                 }
             ]
         }
 
 
+class SpaTask(models.Model):
+    """
+    A task of the outbox that is executed by the `spa_process_tasks` management command.
+    """
+    function_path = models.CharField(_('function path'), max_length=255)
+    kwargs = models.TextField(_('keyword arguments'), default='{}')
+    run_at = models.DateTimeField(_('run at'), db_index=True)
+    attempts = models.PositiveIntegerField(_('attempts'), default=0)
+    failed = models.BooleanField(_('failed'), default=False)
+    last_error = models.TextField(_('last error'), blank=True)
+    created_at = models.DateTimeField(_('created at'), auto_now_add=True)
+
+    class Meta:
+        ordering = ('run_at',)
+        verbose_name = _('task')
+        verbose_name_plural = _('tasks')
+
+    def __str__(self):
+        return self.function_path
+
+
 def set_menu_renderer_context(self, context):
     """
     Monkey patch the MenuRenderer by adding a helper method to store the context.
@@ -104,3 +172,32 @@ def set_menu_renderer_context(self, context):
 
 
 MenuRenderer.set_context = set_menu_renderer_context
+
+_clear_menu_pool = MenuPool.clear
+
+
+def clear_menu_pool(self, *args, **kwargs):
+    """
+    Monkey patch the MenuPool to invalidate the cached menu partials of all processes together with the menus of the
+    CMS (e.g. when an attached menu or a navigation extender changes).
+    """
+    _clear_menu_pool(self, *args, **kwargs)
+    bump_versions([MENUS_VERSION_KEY])
+
+
+MenuPool.clear = clear_menu_pool
+
+_get_visible_nodes = cms_menus.get_visible_nodes
+
+
+def get_visible_nodes(request, pages, site):
+    """
+    Monkey patch the CMS menu to build the nodes of all pages for the menu cache of `get_cms_menu_data_dict`, which
+    checks the visibility of the cached nodes for each request.
+    """
+    if build_all_menu_nodes.get():
+        return list(pages)
+    return _get_visible_nodes(request, pages, site)
+
+
+cms_menus.get_visible_nodes = get_visible_nodes
@@ -0,0 +1,92 @@
+import hashlib
+
+from cms.models import Page, Title
+from cms.utils.page import get_page_from_path
+from django.conf import settings
+from django.core.cache import cache
+from django.db.models import Min
+from django.utils import timezone
+
+from .cache import CACHE_KEY_PREFIX, PAGE_TREE_VERSION_KEY, get_versions
+
+PAGE_NOT_FOUND = 'not-found'
+
+
+def get_page_path_cache_key(site_pk, language_code, path, version):
+    # Paths can be longer than the keys that some cache backends allow.
+    return '{prefix}:page_path:{site}:{language_code}:{path}:{version}'.format(
+        prefix=CACHE_KEY_PREFIX,
+        site=site_pk,
+        language_code=language_code,
+        path=hashlib.md5(path.encode('utf-8')).hexdigest(),
+        version=version
+    )
+
+
+def get_page_and_title_from_path(site, path, language_code, preview=False, draft=False):
+    """
+    Returns the published page of a path and its title in the given language or `(None, None)` if there is no page.
+    The ids and the publication dates of both are cached per site and language until the page tree changes. The
+    objects are loaded by their ids with a single query as long as the page is published at the time of the request.
+    Paths without a page are cached until the next scheduled publication, so requests for nonexistent paths don't
+    query the database. Drafts and previews are never cached.
+    """
+    if draft or preview or not settings.DJANGOCMS_SPA_PAGE_PATH_CACHE_TIMEOUT:
+        return load_page_and_title_from_path(site, path, language_code, preview=preview, draft=draft)
+
+    versions = get_versions([PAGE_TREE_VERSION_KEY])
+    cache_key = get_page_path_cache_key(site.pk, language_code, path, versions[PAGE_TREE_VERSION_KEY])
+
+    cache_entry = cache.get(cache_key)
+    if cache_entry == PAGE_NOT_FOUND:
+        return None, None
+    if isinstance(cache_entry, dict) and is_published(cache_entry['publication_date'],
+                                                      cache_entry['publication_end_date']):
+        try:
+            title = Title.objects.select_related('page__node').get(pk=cache_entry['title_id'])
+        except Title.DoesNotExist:
+            pass
+        else:
+            title.page.title_cache = {title.language: title}
+            return title.page, title
+
+    page, title = load_page_and_title_from_path(site, path, language_code)
+    if page:
+        cache.set(cache_key, {
+            'page_id': page.pk,
+            'title_id': title.pk,
+            'publication_date': page.publication_date,
+            'publication_end_date': page.publication_end_date,
+        }, settings.DJANGOCMS_SPA_PAGE_PATH_CACHE_TIMEOUT)
+    else:
+        cache.set(cache_key, PAGE_NOT_FOUND, get_page_not_found_cache_timeout(site))
+    return page, title
+
+
+def load_page_and_title_from_path(site, path, language_code, preview=False, draft=False):
+    page = get_page_from_path(site=site, path=path, preview=preview, draft=draft)
+    if not page:
+        return None, None
+    return page, page.title_set.get(language=language_code)
+
+
+def is_published(publication_date, publication_end_date):
+    now = timezone.now()
+    if publication_date and publication_date > now:
+        return False
+    return not publication_end_date or publication_end_date > now
+
+
+def get_page_not_found_cache_timeout(site):
+    """
+    Returns how long a path without a page can be cached. A page that is published by its publication date doesn't
+    change the page tree, that's why the timeout ends with the next scheduled publication of the site.
+    """
+    next_publication_date = Page.objects.filter(
+        publisher_is_draft=False, node__site=site, publication_date__gt=timezone.now()
+    ).aggregate(next_publication_date=Min('publication_date'))['next_publication_date']
+
+    timeout = settings.DJANGOCMS_SPA_PAGE_PATH_CACHE_TIMEOUT
+    if next_publication_date:
+        timeout = min(timeout, int((next_publication_date - timezone.now()).total_seconds()) + 1)
+    return timeout
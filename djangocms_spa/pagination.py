@@ -0,0 +1,64 @@
+import base64
+import datetime
+import json
+
+from django.core.serializers.json import DjangoJSONEncoder
+from django.db.models import Q
+
+
+class CursorJSONEncoder(DjangoJSONEncoder):
+    """
+    Encodes dates and times with their full precision. `DjangoJSONEncoder` truncates them to milliseconds, which would
+    skip or repeat objects at the page boundaries.
+    """
+
+    def default(self, o):
+        if isinstance(o, (datetime.date, datetime.time)):
+            return o.isoformat()
+        return super(CursorJSONEncoder, self).default(o)
+
+
+def encode_cursor(values):
+    return base64.urlsafe_b64encode(json.dumps(values, cls=CursorJSONEncoder).encode('utf-8')).decode('ascii')
+
+
+def decode_cursor(cursor):
+    """
+    Returns the list of values of an encoded cursor. Raises a `ValueError` if the cursor is invalid.
+    """
+    try:
+        values = json.loads(base64.urlsafe_b64decode(cursor.encode('ascii')).decode('utf-8'))
+    except (TypeError, UnicodeError, ValueError):
+        raise ValueError('Invalid cursor: %s' % cursor)
+
+    if not isinstance(values, list):
+        raise ValueError('Invalid cursor: %s' % cursor)
+    return values
+
+
+def get_cursor_values(obj, ordering):
+    """
+    Returns the values of the ordering fields of an object. Foreign keys are represented by the value of their column
+    (e.g. `author_id` for `author`).
+    """
+    values = []
+    for field in ordering:
+        field_name = field.lstrip('-')
+        model_field = obj._meta.pk if field_name == 'pk' else obj._meta.get_field(field_name)
+        values.append(getattr(obj, model_field.attname))
+    return values
+
+
+def get_keyset_filter(ordering, values):
+    """
+    Returns the filter for all objects after the object with the given values of the ordering fields. The ordering
+    fields must not be nullable and their combination must be unique (e.g. `('-date', '-pk')`).
+    """
+    keyset_filter = Q()
+    equal_values = {}
+    for field, value in zip(ordering, values):
+        field_name = field.lstrip('-')
+        lookup = '%s__%s' % (field_name, 'lt' if field.startswith('-') else 'gt')
+        keyset_filter |= Q(**dict(equal_values, **{lookup: value}))
+        equal_values[field_name] = value
+    return keyset_filter
@@ -1,11 +1,133 @@
-from menus.menu_pool import menu_pool
+from contextvars import ContextVar
+
+from cms.utils.conf import get_cms_setting
+from cms.utils.page import get_page_queryset
+from cms.utils.page_permissions import user_can_view_all_pages
+from cms.utils.permissions import get_view_restrictions
+from django.conf import settings
+from django.core.cache import cache
+from django.urls import NoReverseMatch
+from django.utils.functional import SimpleLazyObject
+from menus.menu_pool import _build_nodes_inner_for_one_menu, menu_pool
+
+from .cache import CACHE_KEY_PREFIX, MENUS_VERSION_KEY, PAGE_TREE_VERSION_KEY, add_cache_dependencies, get_versions
+
+# Set while the menu nodes of all pages are built for the menu cache (see `djangocms_spa.models.get_visible_nodes`).
+build_all_menu_nodes = ContextVar('djangocms_spa_build_all_menu_nodes', default=False)
 
 
 def get_cms_menu_data_dict(request, renderer=None):
+    """
+    Returns the menu of the current site and language. The menu nodes of all published pages and their view
+    restrictions are cached per site and language until the page tree changes or `menu_pool.clear()` is called (which
+    the CMS does when page permissions change). The nodes the user can't see are removed and the menu modifiers (e.g.
+    the marking of the selected node) are applied for each request. The draft menu of the edit mode is never cached.
+    """
     if not renderer:
         renderer = menu_pool.get_renderer(request)
 
-    nodes = renderer.get_nodes()
+    if renderer.draft_mode_active or not settings.DJANGOCMS_SPA_MENU_CACHE_TIMEOUT:
+        return get_serialized_menu_data_dict(request, renderer)
+
+    versions = get_versions([PAGE_TREE_VERSION_KEY, MENUS_VERSION_KEY])
+    add_cache_dependencies(request, versions)
+    cache_key = '{prefix}:menu_nodes:{site}:{language_code}:{version}:{menus_version}'.format(
+        prefix=CACHE_KEY_PREFIX,
+        site=renderer.site.pk,
+        language_code=renderer.request_language,
+        version=versions[PAGE_TREE_VERSION_KEY],
+        menus_version=versions[MENUS_VERSION_KEY]
+    )
+
+    # The cache returns a new copy of the nodes, which can be modified for the request.
+    menu = cache.get(cache_key)
+    if menu is None:
+        nodes = build_menu_nodes(renderer)
+        menu = {'nodes': nodes, 'view_restrictions': get_menu_view_restrictions(renderer, nodes)}
+        cache.set(cache_key, menu, settings.DJANGOCMS_SPA_MENU_CACHE_TIMEOUT)
+
+    nodes = get_visible_menu_nodes(request, renderer, menu['nodes'], menu['view_restrictions'])
+    nodes = renderer.apply_modifiers(nodes=nodes, post_cut=False)
+    return get_serialized_menu_data_dict(request, renderer, nodes)
+
+
+def build_menu_nodes(renderer):
+    """
+    Builds the nodes of all menus like `MenuRenderer._build_nodes`, but with all published pages (no matter who can see
+    them) and without the menu cache of the CMS, which is per user.
+    """
+    token = build_all_menu_nodes.set(True)
+    try:
+        nodes = []
+        for menu_class_name in renderer.menus:
+            try:
+                menu_nodes = renderer.get_menu(menu_class_name).get_nodes(renderer.request)
+            except NoReverseMatch:
+                # Like the CMS, menus of apphooks whose urls don't exist yet are skipped.
+                menu_nodes = []
+            nodes += _build_nodes_inner_for_one_menu(menu_nodes, menu_class_name)
+        return nodes
+    finally:
+        build_all_menu_nodes.reset(token)
+
+
+def get_menu_view_restrictions(renderer, nodes):
+    """
+    Returns a dict with the users and groups (as `(user_id, group_id)` tuples) that may see each restricted page of the
+    menu nodes by page id.
+    """
+    if not get_cms_setting('PERMISSION'):
+        return {}
+
+    page_ids = [node.id for node in nodes if node.attr.get('is_page')]
+    pages = get_page_queryset(renderer.site, draft=False, published=True).filter(pk__in=page_ids).select_related(
+        'node', 'publisher_public__node').order_by('node__path')
+    # Like the page permissions, the view restrictions are attached to the draft pages.
+    draft_pages = [page.publisher_public for page in pages]
+    restrictions = get_view_restrictions(draft_pages)
+    return {
+        page.pk: [(permission.user_id, permission.group_id) for permission in restrictions[page.publisher_public_id]]
+        for page in pages if restrictions.get(page.publisher_public_id)
+    }
+
+
+def get_visible_menu_nodes(request, renderer, nodes, view_restrictions):
+    """
+    Removes the nodes of the pages the user can't see (and their descendants) from the nodes of all pages. This is the
+    check of `get_visible_nodes` of the CMS menu with the cached view restrictions.
+    """
+    user = request.user
+    if user_can_view_all_pages(user, renderer.site):
+        return nodes
+
+    public_for = get_cms_setting('PUBLIC_FOR')
+    can_see_unrestricted = public_for == 'all' or (public_for == 'staff' and user.is_staff)
+    user_groups = SimpleLazyObject(lambda: frozenset(user.groups.values_list('pk', flat=True)))
+
+    def user_can_see_page(page_id):
+        permissions = view_restrictions.get(page_id)
+        if not permissions:
+            return can_see_unrestricted
+        if not user.is_authenticated:
+            return False
+        return any(user_id == user.pk or group_id in user_groups for user_id, group_id in permissions)
+
+    hidden_nodes = set()
+    for node in nodes:
+        if (node.attr.get('is_page') and not user_can_see_page(node.id)) or id(node.parent) in hidden_nodes:
+            hidden_nodes.add(id(node))
+
+    visible_nodes = [node for node in nodes if id(node) not in hidden_nodes]
+    for node in visible_nodes:
+        node.children = [child_node for child_node in node.children if id(child_node) not in hidden_nodes]
+    return visible_nodes
+
+
+def get_serialized_menu_data_dict(request, renderer=None, nodes=None):
+    if nodes is None:
+        if not renderer:
+            renderer = menu_pool.get_renderer(request)
+        nodes = renderer.get_nodes()
 
     def get_menu_node(node):
         if not node.visible:
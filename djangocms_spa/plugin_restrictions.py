@@ -0,0 +1,58 @@
+from django.conf import settings
+
+from .utils import get_django_request
+
+process_plugin_restrictions = {}
+
+
+def get_plugin_restriction_cache(request):
+    """
+    Returns the cache of the plugin restrictions. The restrictions only depend on the plugin type, the slot and the
+    template, so they are cached for the request or (with `DJANGOCMS_SPA_PLUGIN_RESTRICTION_CACHE = 'process'`) for
+    the whole process until a setting changes.
+    """
+    if settings.DJANGOCMS_SPA_PLUGIN_RESTRICTION_CACHE == 'process':
+        return process_plugin_restrictions
+
+    django_request = get_django_request(request)
+    if not hasattr(django_request, '_spa_plugin_restrictions'):
+        django_request._spa_plugin_restrictions = {}
+    return django_request._spa_plugin_restrictions
+
+
+def get_plugin_restrictions(request, plugin_class, placeholder, page):
+    """
+    Returns the allowed child and parent plugin types of a plugin class in a placeholder.
+    """
+    restriction_cache = get_plugin_restriction_cache(request)
+    cache_key = ('plugin', plugin_class.__name__, placeholder.slot, page.get_template() if page else None)
+
+    if cache_key not in restriction_cache:
+        restriction_cache[cache_key] = (
+            plugin_class.get_child_classes(placeholder, page) or [],
+            plugin_class.get_parent_classes(placeholder, page) or [],
+        )
+
+    child_classes, parent_classes = restriction_cache[cache_key]
+    return list(child_classes), list(parent_classes)
+
+
+def get_allowed_plugins_for_placeholder(request, placeholder):
+    """
+    Returns the plugin types (including the system plugins) that can be added to a placeholder.
+    """
+    from cms.plugin_pool import plugin_pool
+
+    restriction_cache = get_plugin_restriction_cache(request)
+    page = placeholder.page
+    cache_key = ('placeholder', placeholder.slot, page.get_template() if page else None)
+
+    if cache_key not in restriction_cache:
+        plugin_types = [cls.__name__ for cls in plugin_pool.get_all_plugins(placeholder.slot, page)]
+        restriction_cache[cache_key] = plugin_types + plugin_pool.get_system_plugins()
+
+    return list(restriction_cache[cache_key])
+
+
+def clear_process_plugin_restrictions():
+    process_plugin_restrictions.clear()
@@ -0,0 +1,128 @@
+import hashlib
+import threading
+import time
+from functools import lru_cache
+
+import requests
+from django.conf import settings
+from django.core.cache import cache
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+from .cache import CACHE_KEY_PREFIX
+from .utils import get_function_by_path
+
+
+class ReCaptchaVerifier(object):
+    """
+    Verifies reCAPTCHA tokens with a pooled HTTP session. The requests are bounded by timeouts and retried on
+    connection errors. After `DJANGOCMS_SPA_RECAPTCHA_CIRCUIT_BREAKER_THRESHOLD` failed requests in a
+    row, tokens are rejected without a request for `DJANGOCMS_SPA_RECAPTCHA_CIRCUIT_BREAKER_TIMEOUT` seconds. Like
+    the reCAPTCHA API, the verifier accepts each token only once. Verified tokens are remembered and rejected
+    without a request.
+    """
+
+    def __init__(self):
+        self.failures = 0
+        self.circuit_opened_at = None
+        self.lock = threading.Lock()
+        self.session = self.get_session()
+
+    def get_session(self):
+        # A token can only be verified once, so only requests that didn't reach the server (connection errors) are
+        # retried. Read errors and server errors are failed verifications.
+        retry = Retry(
+            total=settings.DJANGOCMS_SPA_RECAPTCHA_RETRIES,
+            read=0,
+            status=0,
+            backoff_factor=0.1,
+            raise_on_status=False
+        )
+        adapter = HTTPAdapter(max_retries=retry, pool_maxsize=settings.DJANGOCMS_SPA_RECAPTCHA_POOL_SIZE)
+
+        session = requests.Session()
+        session.mount('https://', adapter)
+        session.mount('http://', adapter)
+        return session
+
+    def verify(self, token, remote_ip=None):
+        cache_key = '{prefix}:recaptcha:{token}'.format(prefix=CACHE_KEY_PREFIX,
+                                                        token=hashlib.sha256(token.encode('utf-8')).hexdigest())
+        if self.is_circuit_open():
+            return False
+
+        # A token is used up by its verification. It is marked as used before the request, so concurrent requests
+        # can't replay it either.
+        if not cache.add(cache_key, True, settings.DJANGOCMS_SPA_RECAPTCHA_TOKEN_CACHE_TIMEOUT):
+            return False
+
+        try:
+            response = self.session.post(
+                url=settings.RECAPTCHA_URL,
+                data={
+                    'secret': settings.RECAPTCHA_SECRET_KEY,
+                    'response': token,
+                    'remoteip': remote_ip
+                },
+                timeout=(settings.DJANGOCMS_SPA_RECAPTCHA_CONNECT_TIMEOUT,
+                         settings.DJANGOCMS_SPA_RECAPTCHA_READ_TIMEOUT)
+            )
+            if response.status_code != 200:
+                raise requests.HTTPError(response=response)
+            # Proxies and captive portals can answer with other content than JSON.
+            success = response.json().get('success')
+        except (requests.RequestException, ValueError, AttributeError):
+            self.record_failure()
+            cache.delete(cache_key)
+            return False
+
+        self.record_success()
+        return bool(success)
+
+    def is_circuit_open(self):
+        with self.lock:
+            if self.circuit_opened_at is None:
+                return False
+            if time.monotonic() - self.circuit_opened_at < settings.DJANGOCMS_SPA_RECAPTCHA_CIRCUIT_BREAKER_TIMEOUT:
+                return True
+
+            # Let the next request through. The circuit is opened again if it fails.
+            self.circuit_opened_at = None
+            self.failures = settings.DJANGOCMS_SPA_RECAPTCHA_CIRCUIT_BREAKER_THRESHOLD - 1
+            return False
+
+    def record_failure(self):
+        with self.lock:
+            self.failures += 1
+            if self.failures >= settings.DJANGOCMS_SPA_RECAPTCHA_CIRCUIT_BREAKER_THRESHOLD:
+                self.circuit_opened_at = time.monotonic()
+
+    def record_success(self):
+        with self.lock:
+            self.failures = 0
+
+
+class StubReCaptchaVerifier(object):
+    """
+    A verifier for tests and benchmarks that doesn't send any requests. All tokens except empty ones and `invalid`
+    are valid.
+    """
+
+    def verify(self, token, remote_ip=None):
+        return bool(token) and token != 'invalid'
+
+
+def get_recaptcha_verifier():
+    """
+    Returns the process-wide instance of `DJANGOCMS_SPA_RECAPTCHA_VERIFIER`.
+    """
+    return _get_recaptcha_verifier(settings.DJANGOCMS_SPA_RECAPTCHA_VERIFIER)
+
+
+@lru_cache(maxsize=None)
+def _get_recaptcha_verifier(verifier_path):
+    return get_function_by_path(verifier_path)()
+
+
+def clear_recaptcha_verifier():
+    _get_recaptcha_verifier.cache_clear()
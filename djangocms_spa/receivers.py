@@ -0,0 +1,109 @@
+from cms.models import CMSPlugin, Page, PagePermission, Placeholder, StaticPlaceholder, Title
+from cms.signals import post_obj_operation, post_publish, post_unpublish
+from django.db.models.signals import post_delete, post_save
+from django.test.signals import setting_changed
+
+from .cache import (MENUS_VERSION_KEY, PAGE_TREE_VERSION_KEY, STATIC_PLACEHOLDERS_VERSION_KEY, bump_existing_versions,
+                    bump_versions, get_model_version_key, get_object_version_key, get_placeholder_version_key)
+from .form_helpers import get_choices_models
+from .form_schemas import form_schema_pool
+from .language_links import clear_translated_urls
+from .plugin_restrictions import clear_process_plugin_restrictions
+from .recaptcha import clear_recaptcha_verifier
+from .renderer import get_component_name
+from .tasks import clear_task_backend
+
+
+def invalidate_placeholders(placeholder_pks):
+    bump_versions([get_placeholder_version_key(placeholder_pk) for placeholder_pk in placeholder_pks
+                   if placeholder_pk])
+
+
+def plugin_changed(sender, instance, **kwargs):
+    # Plugin models are subclasses of `CMSPlugin`, that's why we can't connect the receiver to a single sender.
+    if isinstance(instance, CMSPlugin):
+        invalidate_placeholders([instance.placeholder_id])
+
+
+def placeholder_changed(sender, instance, **kwargs):
+    invalidate_placeholders([instance.pk])
+
+
+def static_placeholder_changed(sender, instance, **kwargs):
+    # The pools of all processes are cleared with the shared version of the static placeholders.
+    bump_versions([STATIC_PLACEHOLDERS_VERSION_KEY])
+    invalidate_placeholders([instance.draft_id, instance.public_id])
+
+
+def page_published(sender, instance, **kwargs):
+    page_pks = [instance.pk, instance.publisher_public_id]
+    invalidate_placeholders(Placeholder.objects.filter(page__in=[pk for pk in page_pks if pk]).values_list(
+        'pk', flat=True))
+
+
+def page_tree_changed(sender, **kwargs):
+    bump_versions([PAGE_TREE_VERSION_KEY])
+
+
+def page_operation_done(sender, obj=None, **kwargs):
+    # Moving a page only updates the tree nodes and the paths with queries that don't send any model signals.
+    if isinstance(obj, Page):
+        page_tree_changed(sender=sender)
+
+
+def page_permissions_changed(sender, **kwargs):
+    # The cached menu contains the view restrictions of the pages. The CMS only clears its menus when page permissions
+    # change if `CMS_PERMISSION` was active on startup.
+    bump_existing_versions([MENUS_VERSION_KEY])
+
+
+def form_choices_changed(sender, **kwargs):
+    # The compiled form schemas and the responses of the choices endpoint contain the choices of model choice fields.
+    # The receiver is connected to all models, that's why it only touches the cache for the models of these fields.
+    if sender._meta.concrete_model in get_choices_models():
+        bump_existing_versions([get_model_version_key(sender)])
+
+
+def detail_object_changed(sender, instance, **kwargs):
+    # The data of objects that are rendered by `SpaDetailApiView` is cached with the version of the object.
+    if hasattr(sender, 'get_frontend_detail_data_dict'):
+        bump_existing_versions([get_object_version_key(sender, instance.pk)])
+
+
+def settings_changed(sender, setting, **kwargs):
+    if setting.startswith('CMS_') or setting.startswith('DJANGOCMS_SPA_'):
+        clear_process_plugin_restrictions()
+        form_schema_pool.clear()
+        get_component_name.cache_clear()
+        clear_recaptcha_verifier()
+        clear_task_backend()
+        clear_translated_urls()
+
+
+def connect_receivers():
+    post_save.connect(plugin_changed, dispatch_uid='djangocms_spa_plugin_saved')
+    post_delete.connect(plugin_changed, dispatch_uid='djangocms_spa_plugin_deleted')
+    post_save.connect(placeholder_changed, sender=Placeholder, dispatch_uid='djangocms_spa_placeholder_saved')
+    post_delete.connect(placeholder_changed, sender=Placeholder, dispatch_uid='djangocms_spa_placeholder_deleted')
+    post_save.connect(static_placeholder_changed, sender=StaticPlaceholder,
+                      dispatch_uid='djangocms_spa_static_placeholder_saved')
+    post_delete.connect(static_placeholder_changed, sender=StaticPlaceholder,
+                        dispatch_uid='djangocms_spa_static_placeholder_deleted')
+    post_publish.connect(page_published, sender=Page, dispatch_uid='djangocms_spa_page_published')
+    post_unpublish.connect(page_published, sender=Page, dispatch_uid='djangocms_spa_page_unpublished')
+    post_save.connect(page_tree_changed, sender=Page, dispatch_uid='djangocms_spa_page_saved')
+    post_delete.connect(page_tree_changed, sender=Page, dispatch_uid='djangocms_spa_page_deleted')
+    post_save.connect(page_tree_changed, sender=Title, dispatch_uid='djangocms_spa_title_saved')
+    post_delete.connect(page_tree_changed, sender=Title, dispatch_uid='djangocms_spa_title_deleted')
+    post_obj_operation.connect(page_operation_done, dispatch_uid='djangocms_spa_page_operation_done')
+    post_publish.connect(page_tree_changed, sender=Page, dispatch_uid='djangocms_spa_page_tree_published')
+    post_unpublish.connect(page_tree_changed, sender=Page, dispatch_uid='djangocms_spa_page_tree_unpublished')
+    post_save.connect(page_permissions_changed, sender=PagePermission,
+                      dispatch_uid='djangocms_spa_page_permission_saved')
+    post_delete.connect(page_permissions_changed, sender=PagePermission,
+                        dispatch_uid='djangocms_spa_page_permission_deleted')
+    post_save.connect(form_choices_changed, dispatch_uid='djangocms_spa_form_choices_saved')
+    post_delete.connect(form_choices_changed, dispatch_uid='djangocms_spa_form_choices_deleted')
+    post_save.connect(detail_object_changed, dispatch_uid='djangocms_spa_detail_object_saved')
+    post_delete.connect(detail_object_changed, dispatch_uid='djangocms_spa_detail_object_deleted')
+    setting_changed.connect(settings_changed, dispatch_uid='djangocms_spa_settings_changed')
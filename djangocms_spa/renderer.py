@@ -1,6 +1,12 @@
+from functools import lru_cache
+
 from django.conf import settings
 
 from .cms_plugins import SPAPluginMixin
+from .form_helpers import get_choices_url, use_lazy_choices
+from .form_schemas import form_schema_pool
+from .plugin_restrictions import get_plugin_restrictions
+from .url_templates import get_plugin_action_urls
 
 
 class BaseSPARenderer(object):
@@ -17,6 +23,10 @@ class BaseSPARenderer(object):
         }
 
         if editable:
+            child_classes, parent_classes = get_plugin_restrictions(request=request, plugin_class=self.plugin_class,
+                                                                    placeholder=instance.placeholder,
+                                                                    page=instance.page)
+
             # This is the structure of the template `cms/toolbar/plugin.html` that is used to register
             # the frontend editing.
             context['cms'] = [
@@ -31,14 +41,12 @@ class BaseSPARenderer(object):
                     'plugin_language': instance.language,
                     'plugin_parent': instance.parent.id if instance.parent else None,
                     'plugin_order': instance.position,
-                    'plugin_restriction': self.plugin_class.get_child_classes(instance.placeholder,
-                                                                              instance.page) or [],
-                    'plugin_parent_restriction': self.plugin_class.get_parent_classes(instance.placeholder,
-                                                                                      instance.page) or [],
+                    'plugin_restriction': child_classes,
+                    'plugin_parent_restriction': parent_classes,
                     'onClose': False,
                     'addPluginHelpTitle': 'Add plugin to {parent_plugin_name}'.format(
                         parent_plugin_name=instance.get_plugin_name()),
-                    'urls': instance.get_action_urls()
+                    'urls': get_plugin_action_urls(instance)
                 }
             ]
 
@@ -70,12 +78,18 @@ class SPAFormFieldWidgetRenderer(object):
         self.name = name
 
     def render(self):
-        context = {
-            'id': self.name,
-            'label': str(self.field.label),
-            'component': self._get_component_name(),
-            'val': self._get_value_for_field()
-        }
+        """
+        Merges the value, the messages and the state of the field into its schema. The schema of forms with
+        `compile_spa_schema = True` is only compiled once per form class and language.
+        """
+        if getattr(self.form, 'compile_spa_schema', False):
+            base_context, widget_context = form_schema_pool.get_field_schema(
+                form=self.form, name=self.name, compile_field_schema=self.get_field_schema)
+        else:
+            base_context, widget_context = self.get_field_schema()
+
+        context = dict(base_context)
+        context['val'] = self._get_value_for_field()
 
         messages = self._get_messages_for_field()
         context['messages'] = messages
@@ -83,28 +97,43 @@ class SPAFormFieldWidgetRenderer(object):
         state = self._get_state_for_field()
         context['state'] = state
 
+        context.update(widget_context)
+
+        return context
+
+    def get_field_schema(self):
+        """
+        Returns the parts of the field data that don't depend on the form data: the base context and the context of
+        the widget (which is applied after the value, messages and state).
+        """
+        base_context = {
+            'id': self.name,
+            'label': str(self.field.label),
+            'component': self._get_component_name(),
+        }
+
+        widget_context = {}
         if hasattr(self.field.widget, 'input_type'):
-            context['type'] = self.field.widget.input_type
+            widget_context['type'] = self.field.widget.input_type
 
         if self.field.widget.attrs.get('placeholder'):
-            context['placeholder'] = str(self.field.widget.attrs['placeholder'])
+            widget_context['placeholder'] = str(self.field.widget.attrs['placeholder'])
 
         if self.field.widget.attrs.get('spa_attrs'):
-            context.update(self.field.widget.attrs['spa_attrs'])
+            widget_context.update(self.field.widget.attrs['spa_attrs'])
 
         try:
-            widget_context = self.field.widget.render_spa(field=self.field)
+            widget_context.update(self.field.widget.render_spa(field=self.field))
         except:
-            widget_context = {}
+            pass
 
-        context.update(widget_context)
+        if use_lazy_choices(self.field):
+            widget_context['choicesUrl'] = get_choices_url(type(self.form), self.name)
 
-        return context
+        return base_context, widget_context
 
     def _get_component_name(self):
-        widget_class = type(self.field.widget)
-        module_path = '.'.join([widget_class.__module__, widget_class.__name__])
-        return settings.DJANGOCMS_SPA_COMPONENT_NAMES.get(module_path, '')
+        return get_component_name(type(self.field.widget))
 
     def _get_value_for_field(self):
         if hasattr(self.form, 'cleaned_data') and self.name in self.form.cleaned_data.keys():
@@ -142,3 +171,9 @@ class SPAFormFieldWidgetRenderer(object):
             state['error'] = True
 
         return state
+
+
+@lru_cache(maxsize=None)
+def get_component_name(widget_class):
+    module_path = '.'.join([widget_class.__module__, widget_class.__name__])
+    return settings.DJANGOCMS_SPA_COMPONENT_NAMES.get(module_path, '')
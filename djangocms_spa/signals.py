@@ -0,0 +1,4 @@
+from django.dispatch import Signal
+
+# Sent after an instrumented request with the `request`, the `response` and the measured `timings` and `cache` hits.
+request_instrumented = Signal()
@@ -0,0 +1,64 @@
+from cms.models import StaticPlaceholder
+
+from .cache import STATIC_PLACEHOLDERS_VERSION_KEY, get_versions
+
+
+class StaticPlaceholderPool(object):
+    """
+    A process-local registry of static placeholders. The static placeholders of the requested partials are resolved
+    with a single query. They are kept (as well as the codes without a static placeholder) with the shared version of
+    the static placeholders, so every process queries them again as soon as a static placeholder was saved or deleted.
+    """
+
+    def __init__(self):
+        self.static_placeholders = {}
+        self.missing_codes = set()
+        self.version = None
+
+    def get_static_placeholders(self, codes, create_missing=False):
+        """
+        Returns a list with the static placeholder (or `None` if it doesn't exist) of each code. Missing static
+        placeholders are only created if `create_missing` is set. This way the read path never writes to the database.
+        """
+        version = get_versions([STATIC_PLACEHOLDERS_VERSION_KEY])[STATIC_PLACEHOLDERS_VERSION_KEY]
+        if version != self.version:
+            self.clear()
+            self.version = version
+
+        unknown_codes = [code for code in codes
+                         if code not in self.static_placeholders and code not in self.missing_codes]
+        if unknown_codes:
+            self._load_static_placeholders(unknown_codes)
+            self.missing_codes.update(code for code in unknown_codes if code not in self.static_placeholders)
+
+        static_placeholders = []
+        for code in codes:
+            static_placeholder = self.static_placeholders.get(code)
+
+            if not static_placeholder and create_missing:
+                static_placeholder = StaticPlaceholder.objects.get_or_create(
+                    code=code,
+                    defaults={'creation_method': StaticPlaceholder.CREATION_BY_TEMPLATE}
+                )[0]
+                self.static_placeholders[code] = static_placeholder
+                self.missing_codes.discard(code)
+
+            static_placeholders.append(static_placeholder)
+
+        return static_placeholders
+
+    def clear(self):
+        self.static_placeholders = {}
+        self.missing_codes = set()
+        self.version = None
+
+    def _load_static_placeholders(self, codes):
+        static_placeholders = StaticPlaceholder.objects.filter(code__in=codes).select_related('draft', 'public')
+        for static_placeholder in static_placeholders:
+            # Static placeholders without a site are preferred over site specific ones with the same code.
+            registered_static_placeholder = self.static_placeholders.get(static_placeholder.code)
+            if not registered_static_placeholder or registered_static_placeholder.site_id:
+                self.static_placeholders[static_placeholder.code] = static_placeholder
+
+
+static_placeholder_pool = StaticPlaceholderPool()
@@ -0,0 +1,115 @@
+import json
+import logging
+import time
+import traceback
+from concurrent.futures import ThreadPoolExecutor
+from datetime import timedelta
+from functools import lru_cache
+
+from django.conf import settings
+from django.db import close_old_connections, connection, transaction
+from django.utils import timezone
+
+from .utils import get_function_by_path
+
+logger = logging.getLogger(__name__)
+
+
+def enqueue_task(function_path, **kwargs):
+    """
+    Queues the call of a function (e.g. `my_app.tasks.send_mail`) with JSON serializable keyword arguments. The task
+    is executed by `DJANGOCMS_SPA_TASK_BACKEND` after the current transaction was committed.
+    """
+    get_task_backend().enqueue(function_path, kwargs)
+
+
+def get_task_backend():
+    return _get_task_backend(settings.DJANGOCMS_SPA_TASK_BACKEND)
+
+
+@lru_cache(maxsize=None)
+def _get_task_backend(backend_path):
+    return get_function_by_path(backend_path)()
+
+
+def clear_task_backend():
+    _get_task_backend.cache_clear()
+
+
+def get_retry_delay(attempt):
+    return settings.DJANGOCMS_SPA_TASK_RETRY_DELAY * 2 ** (attempt - 1)
+
+
+class ThreadPoolTaskBackend(object):
+    """
+    Executes the tasks in a process-local thread pool. Failed tasks are retried up to `DJANGOCMS_SPA_TASK_RETRIES`
+    times. Tasks that are still queued when the process ends are lost, use the `OutboxTaskBackend` if that is not
+    acceptable.
+    """
+
+    def __init__(self):
+        self.executor = ThreadPoolExecutor(max_workers=settings.DJANGOCMS_SPA_TASK_THREADS,
+                                           thread_name_prefix='djangocms_spa_tasks')
+
+    def enqueue(self, function_path, kwargs):
+        transaction.on_commit(lambda: self.executor.submit(self.run, function_path, kwargs))
+
+    def run(self, function_path, kwargs):
+        attempt = 1
+        while True:
+            close_old_connections()
+            try:
+                return get_function_by_path(function_path)(**kwargs)
+            except Exception:
+                if attempt > settings.DJANGOCMS_SPA_TASK_RETRIES:
+                    logger.exception('Task %s failed after %s attempts.', function_path, attempt)
+                    return None
+                time.sleep(get_retry_delay(attempt))
+                attempt += 1
+            finally:
+                close_old_connections()
+
+
+class OutboxTaskBackend(object):
+    """
+    Stores the tasks in the outbox table in the transaction of the request. They are executed by the
+    `spa_process_tasks` management command.
+    """
+
+    def enqueue(self, function_path, kwargs):
+        from .models import SpaTask
+
+        SpaTask.objects.create(function_path=function_path, kwargs=json.dumps(kwargs), run_at=timezone.now())
+
+
+def process_outbox_tasks(limit=100):
+    """
+    Executes the due tasks of the outbox. Each task is leased for `DJANGOCMS_SPA_TASK_LEASE_TIMEOUT` seconds, so
+    multiple workers can process the outbox at the same time. Returns the number of executed tasks.
+    """
+    from .models import SpaTask
+
+    with transaction.atomic():
+        now = timezone.now()
+        tasks = SpaTask.objects.filter(failed=False, run_at__lte=now).select_for_update(
+            skip_locked=connection.features.has_select_for_update_skip_locked)
+        tasks = list(tasks[:limit])
+        SpaTask.objects.filter(pk__in=[task.pk for task in tasks]).update(
+            run_at=now + timedelta(seconds=settings.DJANGOCMS_SPA_TASK_LEASE_TIMEOUT))
+
+    for task in tasks:
+        try:
+            get_function_by_path(task.function_path)(**json.loads(task.kwargs))
+        except Exception:
+            task.attempts += 1
+            task.last_error = traceback.format_exc()
+            if task.attempts > settings.DJANGOCMS_SPA_TASK_RETRIES:
+                task.failed = True
+                logger.error('Task %s failed after %s attempts.', task.function_path, task.attempts)
+            else:
+                task.run_at = timezone.now() + timedelta(seconds=get_retry_delay(task.attempts))
+            task.save(update_fields=['attempts', 'last_error', 'failed', 'run_at'])
+        else:
+            task.delete()
+
+    return len(tasks)
@@ -0,0 +1,65 @@
+from django.urls import get_urlconf, reverse
+from django.utils.translation import get_language
+
+# This pk is reversed once and replaced by the real pk in the url template.
+URL_TEMPLATE_PK = 918273645
+MAX_PLACEHOLDER_URL_TEMPLATES = 10000
+
+url_templates = {}
+placeholder_url_templates = {}
+
+
+def get_url(viewname, pk=None, reverse_function=reverse):
+    """
+    Returns the url of a view that takes no argument or a pk. The url is reversed once per process, language and
+    urlconf and then filled in by string substitution.
+    """
+    cache_key = (reverse_function, viewname, pk is None, get_language(), get_urlconf())
+    if cache_key not in url_templates:
+        args = () if pk is None else (URL_TEMPLATE_PK,)
+        url_templates[cache_key] = reverse_function(viewname, args=args)
+
+    return fill_url_template(url_templates[cache_key], pk)
+
+
+def get_placeholder_url_templates(placeholder):
+    """
+    Returns the admin url templates of a placeholder. The admin urls depend on the model the placeholder is attached
+    to, which is expensive to find out. This is why they are resolved once per placeholder and language.
+    """
+    cache_key = (placeholder.pk, get_language(), get_urlconf())
+    if cache_key not in placeholder_url_templates:
+        if len(placeholder_url_templates) >= MAX_PLACEHOLDER_URL_TEMPLATES:
+            placeholder_url_templates.clear()
+
+        placeholder_url_templates[cache_key] = {
+            'edit_plugin': placeholder.get_edit_url(URL_TEMPLATE_PK),
+            'add_plugin': placeholder.get_add_url(),
+            'delete_plugin': placeholder.get_delete_url(URL_TEMPLATE_PK),
+            'move_plugin': placeholder.get_move_url(),
+            'copy_plugin': placeholder.get_copy_url(),
+        }
+
+    return placeholder_url_templates[cache_key]
+
+
+def get_plugin_action_urls(plugin):
+    """
+    Returns the same urls as `CMSPlugin.get_action_urls()` without reversing them for each plugin.
+    """
+    from cms.models import CMSPlugin
+
+    if type(plugin).get_action_urls is not CMSPlugin.get_action_urls:
+        # Respect plugin models that have their own urls.
+        return plugin.get_action_urls()
+
+    return {
+        action: fill_url_template(url_template, plugin.pk)
+        for action, url_template in get_placeholder_url_templates(plugin.placeholder).items()
+    }
+
+
+def fill_url_template(url_template, pk):
+    if pk is None:
+        return url_template
+    return url_template.replace(str(URL_TEMPLATE_PK), str(pk))
@@ -1,9 +1,11 @@
 from django.urls import path, re_path
 
-from .views import SpaCmsPageDetailApiView
+from .views import SpaCmsPageDetailApiView, SpaFormChoicesApiView, SpaPartialsApiView
 
 app_name = 'djangocms_spa'
 urlpatterns = [
     path('pages/', SpaCmsPageDetailApiView.as_view(), name='cms_page_detail_home'),
     re_path(r'^pages/(?P<path>.*)/$', SpaCmsPageDetailApiView.as_view(), name='cms_page_detail'),
+    path('partials/', SpaPartialsApiView.as_view(), name='partials'),
+    path('form-choices/', SpaFormChoicesApiView.as_view(), name='form_choices'),
 ]
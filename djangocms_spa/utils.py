@@ -1,5 +1,7 @@
+import asyncio
 from importlib import import_module
 
+from asgiref.sync import sync_to_async
 from django.conf import settings
 from django.urls import resolve
 
@@ -40,3 +42,20 @@ def get_view_from_url(url):
     view_module_path = resolved_url._func_path  # e.g. my_app.views.views.MyListView
     view = get_function_by_path(view_module_path)
     return view
+
+
+def get_django_request(request):
+    """
+    Returns the Django `HttpRequest` of a REST framework request. Attributes that need to be shared by all helpers of
+    a request are stored on the Django request because the REST framework request is only a wrapper.
+    """
+    return getattr(request, '_request', request)
+
+
+async def call_async(function, *args, **kwargs):
+    """
+    Awaits coroutine functions and calls all other functions in a thread.
+    """
+    if asyncio.iscoroutinefunction(function):
+        return await function(*args, **kwargs)
+    return await sync_to_async(function)(*args, **kwargs)
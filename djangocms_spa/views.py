@@ -1,21 +1,33 @@
-from contextlib import suppress
+from urllib.parse import urlencode
+from urllib.request import url2pathname
 
 from cms.utils.moderator import use_draft
-from cms.utils.page import get_page_from_path
 from django.conf import settings
 from django.contrib.sites.shortcuts import get_current_site
-from django.http import HttpResponse, JsonResponse
-from django.urls import NoReverseMatch, resolve, reverse
-from django.utils.translation import activate
+from django.core import signing
+from django.core.cache import cache
+from django.forms import ModelChoiceField
+from django.http import Http404, HttpResponse, JsonResponse, StreamingHttpResponse
+from django.urls import resolve
 from django.views.generic.detail import SingleObjectMixin
 from django.views.generic.list import MultipleObjectMixin
 from rest_framework.permissions import AllowAny
 from rest_framework.views import APIView
 
-import json
-from .content_helpers import (get_frontend_data_dict_for_cms_page, get_frontend_data_dict_for_partials,
-                              get_partial_names_for_template)
-from .decorators import cache_view
+from .cache import (add_cache_dependencies, collect_cache_dependencies, get_model_version_key, get_object_cache_key,
+                    get_object_version_key, get_versions, has_current_versions)
+from .content_helpers import (get_all_partial_names, get_frontend_data_dict_for_cms_page,
+                              get_frontend_data_dict_for_partials, get_partial_names_for_template,
+                              parse_partial_versions)
+from .decorators import cache_view, get_content_version
+from .form_helpers import CHOICES_SIGNING_SALT, get_choices_page, use_lazy_choices
+from .instrumentation import instrument_view
+from .json_encoders import StreamedDict, StreamedList, dumps, stream_json
+from .language_links import get_translated_urls
+from .page_paths import get_page_and_title_from_path
+from .pagination import decode_cursor, encode_cursor, get_cursor_values, get_keyset_filter
+from .tasks import enqueue_task
+from .utils import get_function_by_path
 
 
 class ObjectPermissionMixin(object):
@@ -46,20 +58,15 @@ class MetaDataMixin(object):
         return meta_data
 
     def get_translated_urls(self):
-        request_language = self.request.LANGUAGE_CODE
         if self.url_name:
             url_name = self.url_name
         else:
-            url_name = resolve(self.request.path).url_name
+            # The url of the request was already resolved by the request handler.
+            resolver_match = getattr(self.request, 'resolver_match', None) or resolve(self.request.path)
+            url_name = resolver_match.url_name
 
-        language_links = {}
-        for language_code, language in settings.LANGUAGES:
-            if language_code != request_language:
-                activate(language_code)
-                with suppress(NoReverseMatch):
-                    language_links[language_code] = reverse(url_name, args=self.args, kwargs=self.kwargs)
-        activate(request_language)
-        return language_links
+        return get_translated_urls(url_name, args=self.args, kwargs=self.kwargs,
+                                   exclude_language_code=self.request.LANGUAGE_CODE)
 
 
 class MultipleObjectSpaMixin(MetaDataMixin, ObjectPermissionMixin, MultipleObjectMixin):
@@ -67,13 +74,93 @@ class MultipleObjectSpaMixin(MetaDataMixin, ObjectPermissionMixin, MultipleObjec
     model = None
     queryset = None
     permission_classes = [AllowAny]
+    # With `paginate_by`, the list is paginated by `?page=` (`'page'`) or by `?cursor=` (`'cursor'`). The cursor
+    # pagination orders the list by `cursor_ordering`, which must end with a unique field.
+    pagination_type = 'page'
+    cursor_ordering = ('-pk',)
+    # These are applied to the queryset of the list (`select_related`, `prefetch_related` and `only`).
+    list_select_related = None
+    list_prefetch_related = None
+    list_only_fields = None
+    pagination = None
 
     def get(self, request, *args, **kwargs):
-        self.object_list = self.get_queryset()
+        self.object_list = self.get_list_queryset()
+        self.pagination = self.paginate_object_list()
         return super(MultipleObjectSpaMixin, self).get(request, *args, **kwargs)
 
+    def get_list_queryset(self):
+        queryset = self.get_queryset()
+        if self.list_select_related:
+            queryset = queryset.select_related(*self.list_select_related)
+        if self.list_prefetch_related:
+            queryset = queryset.prefetch_related(*self.list_prefetch_related)
+        if self.list_only_fields:
+            queryset = queryset.only(*self.list_only_fields)
+        return queryset
+
+    def paginate_object_list(self):
+        """
+        Replaces the object list with the objects of the requested page and returns the pagination data of the
+        response (or `None` if the list isn't paginated).
+        """
+        page_size = self.get_paginate_by(self.object_list)
+        if not page_size:
+            return None
+
+        if self.pagination_type == 'cursor':
+            return self.paginate_object_list_by_cursor(page_size)
+
+        paginator, page, self.object_list, is_paginated = self.paginate_queryset(self.object_list, page_size)
+        return {
+            'page': page.number,
+            'pages': paginator.num_pages,
+            'count': paginator.count,
+            'next': page.next_page_number() if page.has_next() else None,
+            'previous': page.previous_page_number() if page.has_previous() else None,
+        }
+
+    def paginate_object_list_by_cursor(self, page_size):
+        cursor = self.request.GET.get('cursor')
+        queryset = self.object_list.order_by(*self.cursor_ordering)
+        if cursor:
+            try:
+                queryset = queryset.filter(get_keyset_filter(self.cursor_ordering, decode_cursor(cursor)))
+            except ValueError:
+                raise Http404('Invalid cursor')
+
+        # The additional object tells us whether there is a next page without counting the objects.
+        objects = list(queryset[:page_size + 1])
+        self.object_list = objects[:page_size]
+        return {
+            'cursor': cursor,
+            'next': encode_cursor(get_cursor_values(objects[page_size - 1], self.cursor_ordering))
+            if len(objects) > page_size else None,
+        }
+
     def get_fetched_data(self):
-        object_list = []
+        data = {
+            'containers': {
+                self.list_container_name: list(self.iter_object_list_data())
+            },
+            'meta': self.get_meta_data()
+        }
+        if self.pagination:
+            data['pagination'] = self.pagination
+        return data
+
+    def get_streamed_fetched_data(self):
+        data = [
+            ('containers', StreamedDict([
+                (self.list_container_name, StreamedList(self.iter_object_list_data()))
+            ])),
+            ('meta', self.get_meta_data())
+        ]
+        if self.pagination:
+            data.append(('pagination', self.pagination))
+        return StreamedDict(data)
+
+    def iter_object_list_data(self):
         editable = self.has_change_permission()
 
         for object in self.object_list:
@@ -83,20 +170,16 @@ class MultipleObjectSpaMixin(MetaDataMixin, ObjectPermissionMixin, MultipleObjec
                     model=object._meta.model_name,
                     pk=object.pk
                 )
-                object_list.append(object.get_frontend_list_data_dict(self.request, editable=editable,
-                                                                      placeholder_name=placeholder_name))
-
-        return {
-            'containers': {
-                self.list_container_name: object_list
-            },
-            'meta': self.get_meta_data()
-        }
+                yield object.get_frontend_list_data_dict(self.request, editable=editable,
+                                                         placeholder_name=placeholder_name)
 
 
 class SingleObjectSpaMixin(MetaDataMixin, ObjectPermissionMixin, SingleObjectMixin):
     object = None
     permission_classes = [AllowAny]
+    # A field that changes with every change of the object (e.g. `updated_at`). It is added to the key of the object
+    # cache in addition to the version that is bumped by the `post_save` and `post_delete` signals.
+    object_version_field = None
 
     def get(self, request, *args, **kwargs):
         self.object = self.get_object()
@@ -106,30 +189,71 @@ class SingleObjectSpaMixin(MetaDataMixin, ObjectPermissionMixin, SingleObjectMix
         data = {}
 
         if hasattr(self.object, 'get_frontend_detail_data_dict'):
-            data = self.object.get_frontend_detail_data_dict(self.request, editable=self.has_change_permission())
+            data = self.get_object_data()
 
         data['meta'] = self.get_meta_data()
         return data
 
+    def get_object_data(self):
+        """
+        Returns the detail data of the object. The data is cached per object and language for anonymous users (no
+        matter which url was used to get it) until the object or one of the placeholders it renders changes.
+        """
+        editable = self.has_change_permission()
+        if editable or self.request.user.is_authenticated or not settings.DJANGOCMS_SPA_OBJECT_CACHE_TIMEOUT:
+            return self.object.get_frontend_detail_data_dict(self.request, editable=editable)
+
+        version_key = get_object_version_key(type(self.object), self.object.pk)
+        versions = get_versions([version_key])
+        add_cache_dependencies(self.request, versions)
+        instance_version = getattr(self.object, self.object_version_field) if self.object_version_field else ''
+        cache_key = get_object_cache_key(self.object, self.request.LANGUAGE_CODE, versions[version_key],
+                                         instance_version)
+
+        cache_entry = cache.get(cache_key)
+        if isinstance(cache_entry, dict) and has_current_versions(cache_entry['dependencies']):
+            add_cache_dependencies(self.request, cache_entry['dependencies'])
+            return cache_entry['data']
+
+        with collect_cache_dependencies(self.request) as dependencies:
+            data = self.object.get_frontend_detail_data_dict(self.request, editable=editable)
+
+        cache.set(cache_key, {'data': data, 'dependencies': dependencies}, settings.DJANGOCMS_SPA_OBJECT_CACHE_TIMEOUT)
+        return data
+
 
 class SpaApiView(APIView):
     template_name = None
     permission_classes = [AllowAny]
+    streaming = settings.DJANGOCMS_SPA_STREAMING_RESPONSE
+
+    @instrument_view
+    def dispatch(self, request, *args, **kwargs):
+        return super(SpaApiView, self).dispatch(request, *args, **kwargs)
 
     def get(self, *args, **kwargs):
-        data = {
-            'data': self.get_fetched_data()
-        }
+        if self.streaming:
+            # The data is rendered while it is sent to the client. Streamed responses are not cached.
+            response = StreamingHttpResponse(
+                streaming_content=stream_json(StreamedDict(self.iter_streamed_response_data()),
+                                              cls=settings.DJANGOCMS_SPA_JSON_ENCODER),
+                content_type='application/json',
+                status=200
+            )
+        else:
+            data = {
+                'data': self.get_fetched_data()
+            }
 
-        partials = self.get_partials()
-        if partials:
-            data['partials'] = partials
+            partials = self.get_partials()
+            if partials:
+                data['partials'] = partials
 
-        response = HttpResponse(
-            content=json.dumps(data, cls=settings.DJANGOCMS_SPA_JSON_ENCODER),
-            content_type='application/json',
-            status=200
-        )
+            response = HttpResponse(
+                content=dumps(data, cls=settings.DJANGOCMS_SPA_JSON_ENCODER),
+                content_type='application/json',
+                status=200
+            )
 
         if hasattr(settings, 'GIT_COMMIT_HASH'):
             response['X-App-Version'] = settings.GIT_COMMIT_HASH
@@ -145,9 +269,23 @@ class SpaApiView(APIView):
             editable=self.request.user.has_perm('cms.edit_static_placeholder'),
         )
 
+    def iter_streamed_response_data(self):
+        yield 'data', self.get_streamed_fetched_data()
+
+        partials = self.get_partials()
+        if partials:
+            yield 'partials', partials
+
     def get_fetched_data(self):
         return {}
 
+    def get_streamed_fetched_data(self):
+        """
+        Returns the data of a streamed response. Views can return `StreamedDict` and `StreamedList` instances that are
+        rendered lazily. Override it together with `get_fetched_data`.
+        """
+        return self.get_fetched_data()
+
     def get_template_names(self):
         return self.template_name
 
@@ -156,6 +294,7 @@ class CachedSpaApiView(SpaApiView):
     add_language_code = True
     cache_key = None
 
+    @instrument_view
     @cache_view
     def dispatch(self, request, *args, **kwargs):
         return super(CachedSpaApiView, self).dispatch(request, *args, **kwargs)
@@ -164,18 +303,30 @@ class CachedSpaApiView(SpaApiView):
         return self.cache_key
 
 
-class SpaCmsPageDetailApiView(CachedSpaApiView):
+class CmsPageMixin(object):
     cms_page = None
     cms_page_title = None
 
+    def load_cms_page(self, request, path):
+        """
+        Sets the CMS page and its title of the path. Returns `False` if there is no page.
+        """
+        self.cms_page, self.cms_page_title = get_page_and_title_from_path(
+            site=get_current_site(request),
+            path=path,
+            language_code=request.LANGUAGE_CODE,
+            preview='preview' in request.GET,
+            draft=use_draft(request)
+        )
+        return bool(self.cms_page)
+
+    def get_template_names(self):
+        return self.cms_page.get_template()
+
+
+class SpaCmsPageDetailApiView(CmsPageMixin, CachedSpaApiView):
     def get(self, request, **kwargs):
-        draft = use_draft(request)
-        preview = 'preview' in request.GET
-        try:
-            self.cms_page = get_page_from_path(site=get_current_site(request), path=kwargs.get('path', ''),
-                                               preview=preview, draft=draft)
-            self.cms_page_title = self.cms_page.title_set.get(language=request.LANGUAGE_CODE)
-        except AttributeError:
+        if not self.load_cms_page(request, path=kwargs.get('path', '')):
             return JsonResponse(data={}, status=404)
 
         return super(SpaCmsPageDetailApiView, self).get(request, **kwargs)
@@ -194,11 +345,109 @@ class SpaCmsPageDetailApiView(CachedSpaApiView):
 
         return data
 
-    def get_template_names(self):
-        return self.cms_page.get_template()
+    def get_streamed_fetched_data(self):
+        return get_frontend_data_dict_for_cms_page(
+            cms_page=self.cms_page,
+            cms_page_title=self.cms_page_title,
+            request=self.request,
+            editable=self.request.user.has_perm('cms.change_page'),
+            streamed=True
+        )
+
+
+class SpaPartialsApiView(CachedSpaApiView):
+    """
+    Returns any set of partials of the current language in one response. Each partial comes with a version (the hash
+    of its JSON). A client that sends the versions it already holds in `?versions=menu:<version>,footer:<version>`
+    only gets the partials that changed and the versions of all requested partials.
+    """
+
+    def get(self, request, *args, **kwargs):
+        held_versions = parse_partial_versions(request.GET.get('versions'))
+        partials = get_frontend_data_dict_for_partials(
+            partials=self.get_partial_names(),
+            request=request,
+            editable=request.user.has_perm('cms.edit_static_placeholder'),
+        )
+
+        # Every partial is serialized once to get its version. The response is assembled from the serialized
+        # partials.
+        changed_partials = []
+        versions = {}
+        for partial, partial_data in partials.items():
+            content = dumps(partial_data, cls=settings.DJANGOCMS_SPA_JSON_ENCODER)
+            versions[partial] = get_content_version(content)
+            if held_versions.get(partial) != versions[partial]:
+                changed_partials.append(dumps(partial) + b':' + content)
+
+        response = HttpResponse(
+            content=b''.join([
+                b'{"partials":{', b','.join(changed_partials), b'},"versions":',
+                dumps(versions, cls=settings.DJANGOCMS_SPA_JSON_ENCODER), b'}'
+            ]),
+            content_type='application/json',
+            status=200
+        )
+
+        if hasattr(settings, 'GIT_COMMIT_HASH'):
+            response['X-App-Version'] = settings.GIT_COMMIT_HASH
+
+        return response
+
+    def get_partial_names(self):
+        """
+        Returns the requested partials (`?partials=menu,footer`) or all partials of the requested template
+        (`?template=pages/content.html`). Only partials that are configured in `DJANGOCMS_SPA_TEMPLATES` can be
+        requested.
+        """
+        requested_partials = self.request.GET.get('partials')
+        if not requested_partials:
+            return get_partial_names_for_template(template=self.request.GET.get('template'))
+
+        all_partial_names = get_all_partial_names()
+        return [partial for partial in url2pathname(requested_partials).split(',') if partial in all_partial_names]
+
+
+class SpaFormChoicesApiView(CachedSpaApiView):
+    """
+    Returns a page of the choices of a form field that uses lazy choices. The field is referenced by the signed
+    `field` parameter of the url that is rendered as `choicesUrl`. The choices can be filtered by the prefix `q`.
+    """
+
+    def get(self, request, *args, **kwargs):
+        try:
+            form_path, field_name = signing.loads(request.GET.get('field', ''), salt=CHOICES_SIGNING_SALT)
+            page = max(int(request.GET.get('page', 1)), 1)
+        except (signing.BadSignature, ValueError):
+            return JsonResponse(data={}, status=404)
+
+        # The choices are taken from the class, so fields that are changed per form instance are not supported.
+        field = get_function_by_path(form_path).base_fields.get(field_name)
+        if not field or not use_lazy_choices(field):
+            return JsonResponse(data={}, status=404)
+
+        if isinstance(field, ModelChoiceField):
+            add_cache_dependencies(request, get_versions([get_model_version_key(field.queryset.model)]))
+
+        items, has_next_page = get_choices_page(field, query=request.GET.get('q', ''), page=page)
+        return HttpResponse(
+            content=dumps({'items': items, 'page': page, 'hasNextPage': has_next_page},
+                          cls=settings.DJANGOCMS_SPA_JSON_ENCODER),
+            content_type='application/json',
+            status=200
+        )
 
 
 class SpaListApiView(MultipleObjectSpaMixin, CachedSpaApiView):
+    def get_cache_key(self):
+        """
+        Every page of the list is cached separately. The query parameters are sorted, so the same page always has the
+        same cache key.
+        """
+        if self.cache_key:
+            return self.cache_key
+        return '%s?%s' % (self.request.path, urlencode(sorted(self.request.GET.lists()), doseq=True))
+
     def get_fetched_data(self):
         data = {}
 
@@ -238,10 +487,17 @@ class SpaFormApiView(SpaApiView):
     def form_valid(self, form):
         form.save()
         self.post_save(form)
-        return JsonResponse(data=(form.get_api_response_data_dict()), status=200)
+        for function_path, kwargs in self.get_post_save_tasks(form):
+            enqueue_task(function_path, **kwargs)
+        return self.get_json_response(data=form.get_api_response_data_dict(), status=200)
 
     def form_invalid(self, form):
-        return JsonResponse(data=form.get_api_response_data_dict(), status=400)
+        return self.get_json_response(data=form.get_api_response_data_dict(), status=400)
+
+    def get_json_response(self, data, status):
+        # The form responses are small and may contain any type that `DjangoJSONEncoder` knows (e.g. the values of
+        # bound fields), that's why they don't use the JSON backend.
+        return JsonResponse(data=data, status=status)
 
     def post_save(self, form):
         """
@@ -249,3 +505,11 @@ class SpaFormApiView(SpaApiView):
         :param form:
         """
         pass
+
+    def get_post_save_tasks(self, form):
+        """
+        Returns a list of `(function_path, kwargs)` tuples that are executed after the response was sent (e.g. to send
+        emails). The keyword arguments need to be JSON serializable.
+        :param form:
+        """
+        return []
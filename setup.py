@@ -59,10 +59,12 @@ setup(
     include_package_data=True,
     install_requires=[
         'django>=2.2',
+        'asgiref>=3.3',
         'django-cms>=3.0',
         'djangorestframework>=3.5.0',
         'django-appconf>=1.0.1',
-        'requests>=2'
+        'requests>=2',
+        'urllib3>=1.26'
     ],
     license="MIT",
     zip_safe=False,
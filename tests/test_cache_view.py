@@ -0,0 +1,54 @@
+from django.core.cache import cache
+from django.test import override_settings
+from django.urls import reverse
+
+from .utils import CacheTestCase, TextPlugin, create_published_page
+
+
+class CacheViewTests(CacheTestCase):
+    def setUp(self):
+        super(CacheViewTests, self).setUp()
+        self.page = create_published_page()
+        self.plugin = self.page.placeholders.get(slot='content').get_plugins('en')[0]
+        self.url = reverse('djangocms_spa:cms_page_detail', kwargs={'path': 'test'})
+
+    def test_responses_have_an_etag(self):
+        response = self.client.get(self.url)
+        self.assertEqual(response.status_code, 200)
+        self.assertTrue(response['ETag'].startswith('"'))
+
+    def test_conditional_requests_with_the_current_etag_are_not_modified(self):
+        etag = self.client.get(self.url)['ETag']
+        with self.assertNumQueries(0):
+            response = self.client.get(self.url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 304)
+        self.assertEqual(response['ETag'], etag)
+        self.assertEqual(response.content, b'')
+
+    def test_rendering_the_same_content_again_keeps_the_etag(self):
+        etag = self.client.get(self.url)['ETag']
+        cache.clear()
+        response = self.client.get(self.url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 304)
+        self.assertEqual(response['ETag'], etag)
+
+    @override_settings(DJANGOCMS_SPA_PLACEHOLDER_CACHE_TIMEOUT=60)
+    def test_changed_content_gets_a_new_etag(self):
+        # The cached responses depend on the versions of the placeholders if the placeholder cache is active.
+        etag = self.client.get(self.url)['ETag']
+        TextPlugin.texts[self.plugin.pk] = 'Changed'
+        try:
+            self.plugin.save()
+            response = self.client.get(self.url, HTTP_IF_NONE_MATCH=etag)
+        finally:
+            del TextPlugin.texts[self.plugin.pk]
+        self.assertEqual(response.status_code, 200)
+        self.assertNotEqual(response['ETag'], etag)
+        self.assertIn(b'Changed', response.content)
+
+    def test_cached_responses_are_served_without_queries(self):
+        content = self.client.get(self.url).content
+        with self.assertNumQueries(0):
+            response = self.client.get(self.url)
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.content, content)
@@ -0,0 +1,64 @@
+import json
+
+from django import forms
+from django.contrib.auth.models import Group
+from django.urls import reverse
+from django.utils.http import urlencode
+
+from djangocms_spa.form_helpers import get_choices_models, get_choices_url
+from djangocms_spa.forms import SpaApiForm
+
+from .utils import CacheTestCase
+
+
+class GroupForm(SpaApiForm):
+    lazy_group = forms.ModelChoiceField(
+        queryset=Group.objects.all(),
+        widget=forms.Select(attrs={'spa_lazy_choices': True, 'spa_search_fields': ['name']})
+    )
+    group = forms.ModelChoiceField(queryset=Group.objects.all())
+
+
+class FormChoicesApiTests(CacheTestCase):
+    def setUp(self):
+        super(FormChoicesApiTests, self).setUp()
+        self.admins = Group.objects.create(name='Admins')
+        self.editors = Group.objects.create(name='Editors')
+
+    def get_choices(self, field_name, **params):
+        url = get_choices_url(GroupForm, field_name)
+        if params:
+            url += '&' + urlencode(params)
+        return self.client.get(url)
+
+    def test_choices_of_lazy_fields_are_returned(self):
+        response = self.get_choices('lazy_group', q='edi')
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(json.loads(response.content), {
+            'items': [{'label': 'Editors', 'val': str(self.editors.pk)}],
+            'page': 1,
+            'hasNextPage': False,
+        })
+
+    def test_lazy_choices_are_opt_in(self):
+        self.assertEqual(self.get_choices('group').status_code, 404)
+
+    def test_fields_without_opt_in_render_their_choices_inline(self):
+        fields = {field.get('id'): field for field in GroupForm().get_spa_data_dict()['fields']}
+        self.assertIn('choicesUrl', fields['lazy_group'])
+        self.assertEqual(fields['lazy_group']['items'], [])
+        self.assertNotIn('choicesUrl', fields['group'])
+        self.assertEqual([item['label'] for item in fields['group']['items']], ['Admins', 'Editors'])
+
+    def test_unsigned_fields_are_rejected(self):
+        url = '%s?field=%s' % (reverse('djangocms_spa:form_choices'), 'tests.test_form_choices.GroupForm:group')
+        self.assertEqual(self.client.get(url).status_code, 404)
+
+    def test_saving_an_object_invalidates_the_choices(self):
+        self.get_choices('lazy_group')
+        viewers = Group.objects.create(name='Viewers')
+        items = json.loads(self.get_choices('lazy_group').content)['items']
+        self.assertEqual(items[-1], {'label': 'Viewers', 'val': str(viewers.pk)})
+
+    def test_models_of_lazy_fields_are_tracked(self):
+        self.assertIn(Group, get_choices_models())
@@ -0,0 +1,43 @@
+import json
+import uuid
+from collections import OrderedDict, UserDict
+
+from django.forms.utils import ErrorDict, ErrorList
+from django.test import SimpleTestCase
+from django.utils.safestring import mark_safe
+from django.utils.translation import gettext_lazy as _
+
+from djangocms_spa.json_encoders import JSON_BACKENDS, LazyJSONEncoder, dumps, stream_json
+
+
+class JSONBackendTests(SimpleTestCase):
+    def get_data(self):
+        return {
+            'messages': {
+                'error': ErrorList(['This field is required.', 'Enter a valid email address.']),
+            },
+            'errors': ErrorDict({'email': ErrorList(['Enter a valid email address.'])}),
+            'uuid': uuid.UUID('12345678-1234-5678-1234-567812345678'),
+            'label': _('Submit'),
+            'text': mark_safe('<p>Äpfel & Birnen</p>'),
+            'ordered': OrderedDict([('b', 1), ('a', [1.5, None, True, (1, 2)])]),
+            'user_dict': UserDict({'key': 'value'}),
+        }
+
+    def test_backends_encode_the_same_values_as_the_stdlib_encoder(self):
+        expected = json.loads(json.dumps(self.get_data(), cls=LazyJSONEncoder))
+        self.assertEqual(expected['messages']['error'], ['This field is required.', 'Enter a valid email address.'])
+        self.assertEqual(expected['uuid'], '12345678-1234-5678-1234-567812345678')
+
+        for backend in JSON_BACKENDS:
+            with self.subTest(backend=backend):
+                try:
+                    output = dumps(self.get_data(), backend=backend)
+                except ImportError:
+                    self.skipTest('%s is not installed' % backend)
+                self.assertEqual(json.loads(output), expected)
+
+    def test_json_backend_returns_the_bytes_of_the_stdlib_encoder(self):
+        expected = json.dumps(self.get_data(), cls=LazyJSONEncoder).encode('utf-8')
+        self.assertEqual(dumps(self.get_data(), backend='json'), expected)
+        self.assertEqual(''.join(stream_json(self.get_data())).encode('utf-8'), expected)
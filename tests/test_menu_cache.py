@@ -0,0 +1,53 @@
+from cms.api import create_page
+from cms.constants import VISIBILITY_USERS
+from cms.models import ACCESS_PAGE, PagePermission
+from django.contrib.auth.models import User
+from django.test import override_settings
+
+from djangocms_spa.partial_callbacks import get_cms_menu_data_dict
+
+from .utils import CacheTestCase, create_published_page, get_request
+
+
+class MenuCacheTests(CacheTestCase):
+    def setUp(self):
+        super(MenuCacheTests, self).setUp()
+        self.home = create_published_page(title='Home', slug='home', in_navigation=True)
+        self.page = create_published_page(title='Test', slug='test', in_navigation=True)
+        self.user = User.objects.create_user('user')
+
+    def get_labels(self, user=None):
+        data = get_cms_menu_data_dict(get_request('/en/', user=user))
+        return [node['label'] for node in data['content']['menu']]
+
+    def test_menu_nodes_are_cached(self):
+        self.assertEqual(self.get_labels(), ['Home', 'Test'])
+        with self.assertNumQueries(0):
+            self.assertEqual(self.get_labels(), ['Home', 'Test'])
+
+    def test_publishing_a_page_invalidates_the_menu(self):
+        self.get_labels()
+        create_published_page(title='New', slug='new', in_navigation=True)
+        self.assertEqual(self.get_labels(), ['Home', 'Test', 'New'])
+
+    def test_modifiers_are_applied_for_each_user(self):
+        create_published_page(title='Members', slug='members', in_navigation=True,
+                              limit_visibility_in_menu=VISIBILITY_USERS)
+        self.assertEqual(self.get_labels(), ['Home', 'Test'])
+        self.assertEqual(self.get_labels(user=self.user), ['Home', 'Test', 'Members'])
+        self.assertEqual(self.get_labels(), ['Home', 'Test'])
+
+    @override_settings(CMS_PERMISSION=True)
+    def test_view_restrictions_are_checked_for_each_user(self):
+        self.get_labels()
+        restricted_page = create_published_page(title='Restricted', slug='restricted', in_navigation=True)
+        create_page('Child', 'test.html', 'en', parent=restricted_page.get_draft_object(), in_navigation=True,
+                    published=True)
+        self.assertEqual(self.get_labels(), ['Home', 'Test', 'Restricted'])
+
+        # The CMS clears the menus when page permissions change.
+        PagePermission.objects.create(page=restricted_page.get_draft_object(), user=self.user, can_view=True,
+                                      grant_on=ACCESS_PAGE)
+        self.assertEqual(self.get_labels(), ['Home', 'Test'])
+        self.assertEqual(self.get_labels(user=self.user), ['Home', 'Test', 'Restricted'])
+        self.assertEqual(self.get_labels(), ['Home', 'Test'])
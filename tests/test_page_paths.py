@@ -0,0 +1,51 @@
+from datetime import timedelta
+from unittest import mock
+
+from django.contrib.sites.models import Site
+from django.test import override_settings
+from django.utils import timezone
+
+from djangocms_spa.page_paths import get_page_and_title_from_path, get_page_not_found_cache_timeout
+
+from .utils import CacheTestCase, create_published_page
+
+
+@override_settings(DJANGOCMS_SPA_PAGE_PATH_CACHE_TIMEOUT=60 * 60)
+class PagePathCacheTests(CacheTestCase):
+    def setUp(self):
+        super(PagePathCacheTests, self).setUp()
+        self.site = Site.objects.get_current()
+        create_published_page(title='Home', slug='home')
+
+    def get_page(self, path):
+        return get_page_and_title_from_path(self.site, path, 'en')[0]
+
+    def test_pages_are_loaded_by_their_cached_ids(self):
+        page = create_published_page()
+        self.assertEqual(self.get_page('test'), page)
+        with self.assertNumQueries(1):
+            cached_page = self.get_page('test')
+        self.assertEqual(cached_page, page)
+        self.assertEqual(cached_page.title_cache['en'].path, 'test')
+
+    def test_paths_without_a_page_are_cached(self):
+        self.assertIsNone(self.get_page('nonexistent'))
+        with self.assertNumQueries(0):
+            self.assertIsNone(self.get_page('nonexistent'))
+
+    def test_publishing_a_page_invalidates_the_paths(self):
+        self.assertIsNone(self.get_page('test'))
+        page = create_published_page()
+        self.assertEqual(self.get_page('test'), page)
+
+    def test_pages_are_not_served_after_their_publication_end_date(self):
+        page = create_published_page(publication_end_date=timezone.now() + timedelta(hours=1))
+        self.assertEqual(self.get_page('test'), page)
+        with mock.patch('django.utils.timezone.now', return_value=timezone.now() + timedelta(hours=2)):
+            self.assertIsNone(self.get_page('test'))
+
+    def test_paths_without_a_page_are_cached_until_the_next_publication(self):
+        self.assertEqual(get_page_not_found_cache_timeout(self.site), 60 * 60)
+        create_published_page(publication_date=timezone.now() + timedelta(minutes=10))
+        self.assertIsNone(self.get_page('test'))
+        self.assertAlmostEqual(get_page_not_found_cache_timeout(self.site), 10 * 60, delta=2)
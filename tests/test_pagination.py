@@ -0,0 +1,58 @@
+import datetime
+
+from django.contrib.admin.models import ADDITION, LogEntry
+from django.contrib.auth.models import User
+from django.test import TestCase
+
+from djangocms_spa.pagination import decode_cursor, encode_cursor, get_cursor_values, get_keyset_filter
+
+
+class CursorPaginationTests(TestCase):
+    def setUp(self):
+        self.users = [User.objects.create_user('user-%s' % index) for index in range(2)]
+        action_time = datetime.datetime(2020, 1, 1, 12, 0, 0, tzinfo=datetime.timezone.utc)
+        # All entries are logged within the same millisecond.
+        for index, microsecond in enumerate([123456, 123999, 123000, 123500]):
+            LogEntry.objects.create(user=self.users[index % 2], action_flag=ADDITION, object_repr='Entry %s' % index,
+                                    action_time=action_time.replace(microsecond=microsecond))
+
+    def paginate(self, ordering):
+        """
+        Returns the pks of all pages with one object per page.
+        """
+        pks = []
+        cursor = None
+        for __ in range(LogEntry.objects.count() + 1):
+            queryset = LogEntry.objects.order_by(*ordering)
+            if cursor:
+                queryset = queryset.filter(get_keyset_filter(ordering, decode_cursor(cursor)))
+            obj = queryset.first()
+            if not obj:
+                return pks
+            pks.append(obj.pk)
+            cursor = encode_cursor(get_cursor_values(obj, ordering))
+        return pks
+
+    def test_datetimes_keep_their_microseconds(self):
+        obj = LogEntry.objects.get(object_repr='Entry 0')
+        values = decode_cursor(encode_cursor(get_cursor_values(obj, ('-action_time', '-pk'))))
+        self.assertEqual(values, ['2020-01-01T12:00:00.123456+00:00', obj.pk])
+
+    def test_pages_contain_each_object_once(self):
+        for ordering in [('-action_time', '-pk'), ('action_time', 'pk')]:
+            with self.subTest(ordering=ordering):
+                expected_pks = list(LogEntry.objects.order_by(*ordering).values_list('pk', flat=True))
+                self.assertEqual(self.paginate(ordering), expected_pks)
+
+    def test_foreign_keys_are_encoded_by_their_value(self):
+        obj = LogEntry.objects.get(object_repr='Entry 1')
+        self.assertEqual(decode_cursor(encode_cursor(get_cursor_values(obj, ('user', 'pk')))), [obj.user_id, obj.pk])
+
+        expected_pks = list(LogEntry.objects.order_by('user', 'pk').values_list('pk', flat=True))
+        self.assertEqual(self.paginate(('user', 'pk')), expected_pks)
+
+    def test_invalid_cursors_are_rejected(self):
+        for cursor in ['not-base64!', encode_cursor({'pk': 1})]:
+            with self.subTest(cursor=cursor):
+                with self.assertRaises(ValueError):
+                    decode_cursor(cursor)
@@ -0,0 +1,76 @@
+import json
+
+from cms.api import add_plugin
+from cms.models import StaticPlaceholder
+from django.test import override_settings
+from django.urls import reverse
+
+from djangocms_spa.cache import bump_versions, get_partial_version_key
+
+from .utils import CacheTestCase, TextPlugin, get_counter_data_dict
+
+
+@override_settings(
+    DJANGOCMS_SPA_TEMPLATES={
+        'test.html': {
+            'frontend_component_name': 'test',
+            'partials': ['footer', 'counter'],
+        },
+    },
+    DJANGOCMS_SPA_PARTIAL_CALLBACKS={
+        'counter': {
+            'callback': 'tests.utils.get_counter_data_dict',
+            'cache_timeout': None,
+        },
+    },
+    DJANGOCMS_SPA_PLACEHOLDER_CACHE_TIMEOUT=60,
+)
+class PartialsApiTests(CacheTestCase):
+    def setUp(self):
+        super(PartialsApiTests, self).setUp()
+        get_counter_data_dict.calls = 0
+        static_placeholder = StaticPlaceholder.objects.create(code='footer')
+        self.plugin = add_plugin(static_placeholder.public, TextPlugin, 'en')
+
+    def get_partials(self, **params):
+        response = self.client.get(reverse('djangocms_spa:partials'), params)
+        self.assertEqual(response.status_code, 200)
+        return json.loads(response.content)
+
+    def test_partials_are_returned_with_their_versions(self):
+        data = self.get_partials(partials='footer,counter,unknown')
+        self.assertEqual(sorted(data['partials']), ['counter', 'footer'])
+        self.assertEqual(sorted(data['versions']), ['counter', 'footer'])
+        self.assertEqual(data['partials']['counter']['content'], {'calls': 1})
+
+    def test_partials_of_a_template_are_returned(self):
+        data = self.get_partials(template='test.html')
+        self.assertEqual(sorted(data['partials']), ['counter', 'footer'])
+
+    def test_partials_with_held_versions_are_left_out(self):
+        versions = self.get_partials(partials='footer,counter')['versions']
+        data = self.get_partials(partials='footer,counter', versions='footer:%s' % versions['footer'])
+        self.assertEqual(list(data['partials']), ['counter'])
+        self.assertEqual(data['versions'], versions)
+
+    def test_changed_static_placeholder_gets_a_new_version(self):
+        versions = self.get_partials(partials='footer,counter')['versions']
+        TextPlugin.texts[self.plugin.pk] = 'Changed'
+        try:
+            self.plugin.save()
+            # The cached response depends on the version of the placeholder.
+            data = self.get_partials(partials='footer,counter')
+        finally:
+            del TextPlugin.texts[self.plugin.pk]
+        self.assertEqual(data['partials']['footer']['plugins'][0]['content']['text'], 'Changed')
+        self.assertNotEqual(data['versions']['footer'], versions['footer'])
+        self.assertEqual(data['versions']['counter'], versions['counter'])
+
+    def test_partial_callbacks_are_cached_until_their_version_is_bumped(self):
+        self.get_partials(partials='counter')
+        self.get_partials(partials='counter', other='parameter')
+        self.assertEqual(get_counter_data_dict.calls, 1)
+
+        bump_versions([get_partial_version_key('counter')])
+        data = self.get_partials(partials='counter')
+        self.assertEqual(data['partials']['counter']['content'], {'calls': 2})
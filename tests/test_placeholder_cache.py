@@ -0,0 +1,60 @@
+from cms.api import add_plugin
+from cms.models import Placeholder
+from django.test import override_settings
+
+from djangocms_spa.content_helpers import get_frontend_data_dict_for_placeholders
+
+from .utils import CacheTestCase, TextPlugin, get_request
+
+
+@override_settings(DJANGOCMS_SPA_PLACEHOLDER_CACHE_TIMEOUT=60)
+class PlaceholderCacheTests(CacheTestCase):
+    def setUp(self):
+        super(PlaceholderCacheTests, self).setUp()
+        self.placeholder = Placeholder.objects.create(slot='content')
+        self.plugin = add_plugin(self.placeholder, TextPlugin, 'en')
+
+    def get_texts(self):
+        data = get_frontend_data_dict_for_placeholders([self.placeholder], request=get_request())
+        return [plugin['content']['text'] for plugin in data['content']['plugins']]
+
+    def test_placeholder_data_is_cached(self):
+        self.assertEqual(self.get_texts(), ['Plugin %s' % self.plugin.pk])
+        with self.assertNumQueries(0):
+            self.assertEqual(self.get_texts(), ['Plugin %s' % self.plugin.pk])
+
+    def test_saving_a_plugin_invalidates_its_placeholder(self):
+        self.get_texts()
+        TextPlugin.texts[self.plugin.pk] = 'Changed'
+        try:
+            self.assertEqual(self.get_texts(), ['Plugin %s' % self.plugin.pk])
+            self.plugin.save()
+            self.assertEqual(self.get_texts(), ['Changed'])
+        finally:
+            del TextPlugin.texts[self.plugin.pk]
+
+    def test_adding_and_deleting_plugins_invalidates_the_placeholder(self):
+        self.get_texts()
+        plugin = add_plugin(self.placeholder, TextPlugin, 'en')
+        self.assertEqual(self.get_texts(), ['Plugin %s' % self.plugin.pk, 'Plugin %s' % plugin.pk])
+        self.plugin.delete()
+        self.assertEqual(self.get_texts(), ['Plugin %s' % plugin.pk])
+
+    def test_plugins_without_cache_are_rendered_every_time(self):
+        TextPlugin.cache = False
+        try:
+            self.get_texts()
+            TextPlugin.texts[self.plugin.pk] = 'Changed'
+            self.assertEqual(self.get_texts(), ['Changed'])
+        finally:
+            TextPlugin.cache = True
+            TextPlugin.texts.pop(self.plugin.pk, None)
+
+    @override_settings(DJANGOCMS_SPA_PLACEHOLDER_CACHE_TIMEOUT=0)
+    def test_placeholder_cache_is_disabled_without_timeout(self):
+        self.get_texts()
+        TextPlugin.texts[self.plugin.pk] = 'Changed'
+        try:
+            self.assertEqual(self.get_texts(), ['Changed'])
+        finally:
+            del TextPlugin.texts[self.plugin.pk]
@@ -0,0 +1,60 @@
+from unittest import mock
+
+import requests
+from django.test import override_settings
+
+from djangocms_spa.recaptcha import ReCaptchaVerifier
+
+from .utils import CacheTestCase
+
+
+def get_response(status_code=200, json=None, content=b''):
+    response = requests.Response()
+    response.status_code = status_code
+    response._content = content
+    if json is not None:
+        response.json = lambda: json
+    return response
+
+
+@override_settings(RECAPTCHA_URL='https://recaptcha.test/verify', RECAPTCHA_SECRET_KEY='secret',
+                   DJANGOCMS_SPA_RECAPTCHA_CIRCUIT_BREAKER_THRESHOLD=2)
+class ReCaptchaVerifierTests(CacheTestCase):
+    def setUp(self):
+        super(ReCaptchaVerifierTests, self).setUp()
+        self.verifier = ReCaptchaVerifier()
+
+    def verify(self, token, response):
+        side_effect = response if isinstance(response, Exception) else None
+        with mock.patch.object(self.verifier.session, 'post', return_value=response, side_effect=side_effect) as post:
+            return self.verifier.verify(token), post.call_count
+
+    def test_tokens_are_only_accepted_once(self):
+        self.assertEqual(self.verify('token', get_response(json={'success': True})), (True, 1))
+        self.assertEqual(self.verify('token', get_response(json={'success': True})), (False, 0))
+        self.assertEqual(self.verify('other-token', get_response(json={'success': True})), (True, 1))
+
+    def test_invalid_tokens_are_rejected(self):
+        self.assertEqual(self.verify('token', get_response(json={'success': False})), (False, 1))
+        self.assertEqual(self.verify('token', get_response(json={'success': True})), (False, 0))
+
+    def test_tokens_can_be_verified_again_after_failed_requests(self):
+        self.assertEqual(self.verify('token', requests.ConnectionError()), (False, 1))
+        self.assertEqual(self.verify('token', get_response(json={'success': True})), (True, 1))
+        self.assertEqual(self.verify('other-token', get_response(status_code=503)), (False, 1))
+        self.assertEqual(self.verify('other-token', get_response(json={'success': True})), (True, 1))
+
+    def test_responses_without_json_are_failed_verifications(self):
+        self.assertEqual(self.verify('token', get_response(content=b'<html></html>')), (False, 1))
+        self.assertEqual(self.verifier.failures, 1)
+
+    def test_circuit_opens_after_failed_requests(self):
+        self.verify('token', get_response(content=b'<html></html>'))
+        self.verify('token', requests.Timeout())
+        self.assertEqual(self.verify('token', get_response(json={'success': True})), (False, 0))
+
+    def test_server_errors_are_not_retried(self):
+        retry = self.verifier.session.get_adapter('https://recaptcha.test').max_retries
+        self.assertEqual(retry.read, 0)
+        self.assertEqual(retry.status, 0)
+        self.assertFalse(retry.is_retry('POST', 503))
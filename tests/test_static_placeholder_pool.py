@@ -0,0 +1,38 @@
+from cms.models import StaticPlaceholder
+
+from djangocms_spa.static_placeholder_pool import StaticPlaceholderPool
+
+from .utils import CacheTestCase
+
+
+class StaticPlaceholderPoolTests(CacheTestCase):
+    def setUp(self):
+        super(StaticPlaceholderPoolTests, self).setUp()
+        # The pool is not the one of the receivers, like the pool of another process.
+        self.pool = StaticPlaceholderPool()
+
+    def test_static_placeholders_are_kept_in_the_pool(self):
+        static_placeholder = StaticPlaceholder.objects.create(code='footer')
+        self.assertEqual(self.pool.get_static_placeholders(['footer', 'header']), [static_placeholder, None])
+        with self.assertNumQueries(0):
+            self.assertEqual(self.pool.get_static_placeholders(['footer', 'header']), [static_placeholder, None])
+
+    def test_creating_a_static_placeholder_clears_the_pool_of_other_processes(self):
+        self.assertEqual(self.pool.get_static_placeholders(['footer']), [None])
+        static_placeholder = StaticPlaceholder.objects.create(code='footer')
+        self.assertEqual(self.pool.get_static_placeholders(['footer']), [static_placeholder])
+
+    def test_recreating_a_static_placeholder_clears_the_pool_of_other_processes(self):
+        static_placeholder = StaticPlaceholder.objects.create(code='footer')
+        self.assertEqual(self.pool.get_static_placeholders(['footer']), [static_placeholder])
+
+        static_placeholder.delete()
+        new_static_placeholder = StaticPlaceholder.objects.create(code='footer')
+        found_static_placeholder = self.pool.get_static_placeholders(['footer'])[0]
+        self.assertEqual(found_static_placeholder, new_static_placeholder)
+        self.assertEqual(found_static_placeholder.public_id, new_static_placeholder.public_id)
+
+    def test_missing_static_placeholders_are_only_created_on_demand(self):
+        static_placeholder = self.pool.get_static_placeholders(['footer'], create_missing=True)[0]
+        self.assertEqual(static_placeholder.code, 'footer')
+        self.assertEqual(self.pool.get_static_placeholders(['footer']), [static_placeholder])
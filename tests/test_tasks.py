@@ -0,0 +1,79 @@
+from datetime import timedelta
+from unittest import mock
+
+from django.test import TestCase, override_settings
+from django.utils import timezone
+
+from djangocms_spa.models import SpaTask
+from djangocms_spa.tasks import OutboxTaskBackend, process_outbox_tasks
+
+calls = []
+
+
+def record_call(**kwargs):
+    calls.append(kwargs)
+
+
+def fail(**kwargs):
+    raise ValueError('Task failed')
+
+
+@override_settings(DJANGOCMS_SPA_TASK_RETRIES=1, DJANGOCMS_SPA_TASK_RETRY_DELAY=10,
+                   DJANGOCMS_SPA_TASK_LEASE_TIMEOUT=60)
+class OutboxTaskTests(TestCase):
+    def setUp(self):
+        del calls[:]
+
+    def enqueue(self, function_path, **kwargs):
+        OutboxTaskBackend().enqueue(function_path, kwargs)
+        return SpaTask.objects.latest('pk')
+
+    def test_due_tasks_are_executed_and_removed(self):
+        self.enqueue('tests.test_tasks.record_call', value=1)
+        self.assertEqual(process_outbox_tasks(), 1)
+        self.assertEqual(calls, [{'value': 1}])
+        self.assertFalse(SpaTask.objects.exists())
+
+    def test_failed_tasks_are_retried_after_a_delay(self):
+        task = self.enqueue('tests.test_tasks.fail')
+        self.assertEqual(process_outbox_tasks(), 1)
+
+        task.refresh_from_db()
+        self.assertEqual(task.attempts, 1)
+        self.assertFalse(task.failed)
+        self.assertIn('Task failed', task.last_error)
+        self.assertGreater(task.run_at, timezone.now() + timedelta(seconds=5))
+        self.assertEqual(process_outbox_tasks(), 0)
+
+        with mock.patch('django.utils.timezone.now', return_value=timezone.now() + timedelta(seconds=11)):
+            self.assertEqual(process_outbox_tasks(), 1)
+        task.refresh_from_db()
+        self.assertEqual(task.attempts, 2)
+        self.assertTrue(task.failed)
+
+        with mock.patch('django.utils.timezone.now', return_value=timezone.now() + timedelta(days=1)):
+            self.assertEqual(process_outbox_tasks(), 0)
+
+    def test_tasks_are_leased_while_they_run(self):
+        task = self.enqueue('tests.test_tasks.record_call')
+
+        def process_tasks_in_another_worker(**kwargs):
+            # The task is leased by the first worker, so the second one doesn't execute it again.
+            self.assertEqual(process_outbox_tasks(), 0)
+            task.refresh_from_db()
+            self.assertGreater(task.run_at, timezone.now() + timedelta(seconds=50))
+
+        with mock.patch('tests.test_tasks.record_call', side_effect=process_tasks_in_another_worker) as call:
+            self.assertEqual(process_outbox_tasks(), 1)
+        self.assertEqual(call.call_count, 1)
+
+    def test_leased_tasks_of_crashed_workers_are_executed_again(self):
+        self.enqueue('tests.test_tasks.record_call')
+        with mock.patch('tests.test_tasks.record_call', side_effect=KeyboardInterrupt):
+            with self.assertRaises(KeyboardInterrupt):
+                process_outbox_tasks()
+        self.assertEqual(process_outbox_tasks(), 0)
+
+        with mock.patch('django.utils.timezone.now', return_value=timezone.now() + timedelta(seconds=61)):
+            self.assertEqual(process_outbox_tasks(), 1)
+        self.assertEqual(len(calls), 1)
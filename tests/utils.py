@@ -0,0 +1,69 @@
+"""
+Plugins, pages and requests for the tests.
+"""
+from cms.api import add_plugin, create_page
+from cms.models import CMSPlugin
+from cms.plugin_pool import plugin_pool
+from cms.utils.conf import get_cms_setting
+from django.contrib.auth.models import AnonymousUser
+from django.core.cache import cache
+from django.test import RequestFactory, TestCase
+
+from djangocms_spa.cms_plugins import SPAPluginBase
+
+
+class TextPlugin(SPAPluginBase):
+    name = 'Text'
+    model = CMSPlugin
+    frontend_component_name = 'cmp-text'
+    texts = {}
+
+    def render_spa(self, request, context, instance):
+        context = super(TextPlugin, self).render_spa(request, context, instance)
+        context['content']['text'] = self.texts.get(instance.pk, 'Plugin %s' % instance.pk)
+        return context
+
+
+if TextPlugin.__name__ not in plugin_pool.plugins:
+    plugin_pool.register_plugin(TextPlugin)
+
+
+def get_request(path='/', user=None, language_code='en', **extra):
+    request = RequestFactory().get(path, **extra)
+    request.user = user or AnonymousUser()
+    request.session = {}
+    request.LANGUAGE_CODE = language_code
+    return request
+
+
+def create_published_page(title='Test', slug='test', plugin_count=1, **kwargs):
+    """
+    Creates and publishes a page with `plugin_count` text plugins in its placeholder and returns the public page.
+    """
+    page = create_page(title, get_cms_setting('TEMPLATES')[0][0], 'en', slug=slug, **kwargs)
+    placeholder = page.placeholders.get(slot='content')
+    for index in range(plugin_count):
+        add_plugin(placeholder, TextPlugin, 'en')
+    page.publish('en')
+    return page.reload().get_public_object()
+
+
+class CacheTestCase(TestCase):
+    """
+    Clears the cache before each test, so the versions and the cached data of other tests are not used.
+    """
+
+    def setUp(self):
+        super(CacheTestCase, self).setUp()
+        cache.clear()
+
+
+def get_counter_data_dict(request, renderer=None):
+    """
+    A partial callback that counts its calls.
+    """
+    get_counter_data_dict.calls += 1
+    return {'type': 'generic', 'content': {'calls': get_counter_data_dict.calls}}
+
+
+get_counter_data_dict.calls = 0